@@ -3,37 +3,147 @@ Main CLI entry point for iSulad Performance Testing Framework
 """
 
 import asyncio
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
+from typing import Optional
 
 import click
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.text import Text
 
 from core.config import Config
 from core.logger import setup_logging, get_logger
 from engines import create_engine, list_engines as list_engines_registry
 from executor import create_executor, list_executors as list_executors_registry
-from processor import DataAnalyzer
-from reporter import ConsoleReporter, HTMLReporter
-from core.envinfo import collect_env_info
-from utils.artifacts import make_run_dir, write_json
+from utils.artifacts import dumps_json, make_run_dir, write_bytes, write_json
 
 console = Console()
 logger = get_logger()
 
 
 def run_async(coro):
-    """Run an async coroutine from sync click commands."""
-    return asyncio.run(coro)
+    """Run an async coroutine from sync click commands (on the invocation's shared loop)."""
+    ctx = click.get_current_context(silent=True)
+    loop = ctx.obj.get("loop") if ctx is not None and isinstance(ctx.obj, dict) else None
+    if loop is None or loop.is_closed():
+        return asyncio.run(coro)
+    return loop.run_until_complete(coro)
+
+
+def _install_uvloop() -> bool:
+    """Use uvloop's event loop policy when it is installed (optional dependency)."""
+    # ISULAD_PERF_NO_UVLOOP=1 keeps the stdlib loop, e.g. to A/B the loop implementation itself.
+    if os.environ.get("ISULAD_PERF_NO_UVLOOP"):
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop):
+    """Shut down the shared event loop created by the `cli` group."""
+    if loop.is_closed():
+        return
+    try:
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        # shutdown_default_executor() is Python 3.9+; setup.py still supports 3.8.
+        if hasattr(loop, "shutdown_default_executor"):
+            loop.run_until_complete(loop.shutdown_default_executor())
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+async def _gather_limited(factories, limit: int = 1):
+    """
+    Run coroutine factories concurrently (at most `limit` in flight), preserving input order.
+
+    limit=1 keeps the historical sequential behavior; benchmarking several runtimes on the same
+    host at once trades wall time for cross-engine interference, so it must be opt-in.
+    limit<=0 runs every job at once.
+
+    If a job raises, jobs that have not started yet are skipped, while jobs already running are left to
+    finish so every started executor reaches its teardown; the first error is then re-raised.
+    """
+    unbounded = limit is not None and int(limit) <= 0
+    sem = None if unbounded else asyncio.Semaphore(max(1, int(limit or 1)))
+    errors = []
+
+    async def _guarded(factory):
+        if errors:
+            return None
+        try:
+            return await factory()
+        except Exception as e:
+            errors.append(e)
+            raise
+
+    async def _one(factory):
+        if sem is None:
+            return await _guarded(factory)
+        async with sem:
+            return await _guarded(factory)
+
+    results = await asyncio.gather(*[_one(f) for f in factories], return_exceptions=True)
+    if errors:
+        raise errors[0]
+    return results
+
+
+# Registries are static for the lifetime of the process: sort the names once at import.
+_ENGINE_NAMES = tuple(sorted(list_engines_registry().keys()))
+_EXECUTOR_NAMES = tuple(sorted(list_executors_registry().keys()))
+# Choice types are stateless, so every option/argument shares one instance.
+_ENGINE_CHOICE = click.Choice(_ENGINE_NAMES, case_sensitive=False)
+_EXECUTOR_CHOICE = click.Choice(_EXECUTOR_NAMES, case_sensitive=False)
+
+_BENCH_SUITES = (
+    "standard", "standard_offline", "extended", "extended_offline", "client", "client_offline", "client_extended",
+)
+# Config key paths for each suite's test list, split once instead of per lookup.
+_BENCH_TEST_KEYS = {suite: ("benchmarks", f"{suite}_tests") for suite in _BENCH_SUITES}
+
 
+# (executor_type, engine) combinations that cannot run, with the reason shown when skipping.
+_INCOMPATIBLE = {
+    ("cri", "docker"): "docker is not a CRI runtime",
+    ("client", "crio"): "no client interface",
+    ("client", "containerd"): "no client interface",
+}
 
-def _engine_choice() -> click.Choice:
-    return click.Choice(sorted(list_engines_registry().keys()), case_sensitive=False)
+# Hard errors for commands that target a single engine (run/health).
+_MODE_ERRORS = {
+    "cri": "docker不是CRI运行时，不能使用CRI模式（请用 client 模式或选择 isulad/crio/containerd）",
+    "client": "crio/containerd 不支持 client 模式（请用 cri 模式或选择 isulad/docker）",
+}
 
 
-def _executor_choice() -> click.Choice:
-    return click.Choice(sorted(list_executors_registry().keys()), case_sensitive=False)
+def _incompatible(executor_type: str, engine_name: str) -> Optional[str]:
+    """Return why `engine_name` can't be driven through `executor_type`, or None if it can."""
+    return _INCOMPATIBLE.get((executor_type, engine_name))
+
+
+def _use_live_progress() -> bool:
+    """Live spinner only for interactive terminals; redirected output / CI gets no refresh thread."""
+    return console.is_terminal and not os.environ.get("CI")
+
+
+def _parse_concurrency_levels(spec: str) -> list:
+    """Parse "1,2,4,8" into positive ints; blank, non-numeric and non-positive parts are ignored."""
+    levels = []
+    for part in spec.split(","):
+        part = part.strip()
+        if part.isdigit() and int(part) > 0:
+            levels.append(int(part))
+    if not levels:
+        raise ValueError("Invalid --concurrency-levels. Example: --concurrency-levels 1,2,4,8")
+    return levels
 
 
 @click.group()
@@ -43,34 +153,59 @@ def _executor_choice() -> click.Choice:
 def cli(ctx, config_file, verbose):
     """iSulad Performance Testing Framework CLI"""
     config = Config(config_file)
-    ctx.obj = {"config": config}
+    # One event loop per CLI invocation, reused by every run_async() call of the command.
+    use_uvloop = _install_uvloop()
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    ctx.obj = {"config": config, "loop": loop}
+    ctx.call_on_close(lambda: _close_loop(loop))
 
     log_level = "DEBUG" if verbose else config.get_logging_config().get("level", "INFO")
-    config.get_logging_config()["level"] = log_level
+    config.set("logging.level", log_level)
     setup_logging(config.get_logging_config())
+    logger.debug(f"Event loop: {'uvloop' if use_uvloop else 'asyncio'} ({type(loop).__name__})")
 
 
-def _save_artifacts(run_dir: Path, processed_data, raw: dict):
-    """Persist standardized artifacts to run_dir."""
+def _save_artifacts(run_dir: Path, processed_data, raw):
+    """Persist standardized artifacts to run_dir (`raw` may be pre-encoded JSON bytes)."""
     meta = processed_data.metadata or {}
-    write_json(run_dir / "meta.json", meta)
+    artifacts = [(run_dir / "meta.json", meta)]
     if isinstance(meta, dict) and "env" in meta:
-        write_json(run_dir / "env.json", meta.get("env"))
-
-    write_json(run_dir / "raw_results.json", raw)
-    write_json(
-        run_dir / "processed.json",
-        {
-            "processed_data": processed_data.processed_data,
-            "metadata": processed_data.metadata,
-            "timestamp": processed_data.timestamp,
-        },
+        artifacts.append((run_dir / "env.json", meta.get("env")))
+    artifacts.append((run_dir / "raw_results.json", raw))
+    artifacts.append(
+        (
+            run_dir / "processed.json",
+            {
+                "processed_data": processed_data.processed_data,
+                "metadata": processed_data.metadata,
+                "timestamp": processed_data.timestamp,
+            },
+        )
     )
 
+    # Independent files: overlap the writes (file I/O releases the GIL).
+    with ThreadPoolExecutor(max_workers=len(artifacts)) as pool:
+        futures = [
+            pool.submit(write_bytes if isinstance(data, bytes) else write_json, path, data)
+            for path, data in artifacts
+        ]
+        for fut in futures:
+            fut.result()
+
+
+def _write_html_report(processed_data, run_dir: Path, output: Optional[str]) -> str:
+    """Render the HTML report (default: <run_dir>/report.html) and return the path actually written."""
+    from reporter import HTMLReporter
+
+    if output:
+        return HTMLReporter().report(processed_data, output)
+    return HTMLReporter(output_dir=str(run_dir)).report(processed_data, "report.html")
+
 
 @cli.command()
-@click.argument("executor_type", type=_executor_choice())
-@click.argument("engine_name", type=_engine_choice())
+@click.argument("executor_type", type=_EXECUTOR_CHOICE)
+@click.argument("engine_name", type=_ENGINE_CHOICE)
 @click.argument("test_name")
 @click.option("--iterations", "-i", type=int, help="Number of test iterations")
 @click.option("--warmup-iterations", type=int, help="Number of warmup iterations (set 0 to disable warmup)")
@@ -81,6 +216,12 @@ def _save_artifacts(run_dir: Path, processed_data, raw: dict):
 @click.pass_context
 def run(ctx, executor_type, engine_name, test_name, iterations, warmup_iterations, concurrency, duration, output, format):
     """Run performance tests"""
+    # Heavy modules (numpy via processor, reporters) are only imported by commands that use them,
+    # keeping `list-*` / `health` startup cheap.
+    from core.envinfo import collect_env_info_async
+    from processor import DataAnalyzer
+    from reporter import ConsoleReporter
+
     config = ctx.obj["config"]
 
     try:
@@ -98,19 +239,23 @@ def run(ctx, executor_type, engine_name, test_name, iterations, warmup_iteration
             f"[bold blue]Running {test_name} test with {engine_name} engine using {executor_type} interface[/bold blue]"
         )
 
-        if executor_type == "cri" and engine_name == "docker":
-            raise ValueError("docker不是CRI运行时，不能使用CRI模式（请用 client 模式或选择 isulad/crio/containerd）")
-        if executor_type == "client" and engine_name in ("crio", "containerd"):
-            raise ValueError("crio/containerd 不支持 client 模式（请用 cri 模式或选择 isulad/docker）")
+        if _incompatible(executor_type, engine_name):
+            raise ValueError(_MODE_ERRORS[executor_type])
 
         engine_cfg = config.get_engine_config(engine_name)
         engine = create_engine(engine_name, engine_cfg)
         executor = create_executor(executor_type, engine, test_config)
 
-        with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
-            task = progress.add_task("Running performance test...", total=None)
+        if _use_live_progress():
+            from rich.progress import Progress, SpinnerColumn, TextColumn
+
+            with Progress(SpinnerColumn(), TextColumn("[progress.description]{task.description}"), console=console) as progress:
+                task = progress.add_task("Running performance test...", total=None)
+                test_result = run_async(executor.run_test(test_name))
+                progress.update(task, completed=True)
+        else:
+            console.print("Running performance test...", markup=False, highlight=False)
             test_result = run_async(executor.run_test(test_name))
-            progress.update(task, completed=True)
 
         analyzer = DataAnalyzer(baseline_engine="isulad")
         analyzer.set_metadata(
@@ -131,10 +276,10 @@ def run(ctx, executor_type, engine_name, test_name, iterations, warmup_iteration
         )
         analyzer.set_metadata(
             "env",
-            collect_env_info(
+            run_async(collect_env_info_async(
                 engines=[engine_name],
                 cri_endpoints={engine_name: engine.config.endpoint} if executor_type == "cri" else {},
-            ),
+            )),
         )
         processed_data = analyzer.process([test_result])
 
@@ -146,7 +291,9 @@ def run(ctx, executor_type, engine_name, test_name, iterations, warmup_iteration
             engines=[engine_name],
             test_name=test_name,
         )
-        _save_artifacts(run_dir, processed_data, {"test_result": test_result})
+        # -f json writes the same payload as raw_results.json: encode it once and share the bytes.
+        raw_payload = dumps_json({"test_result": test_result}) if format == "json" else {"test_result": test_result}
+        _save_artifacts(run_dir, processed_data, raw_payload)
 
         if format == "console":
             reporter = ConsoleReporter()
@@ -155,13 +302,11 @@ def run(ctx, executor_type, engine_name, test_name, iterations, warmup_iteration
             else:
                 reporter.report(processed_data)
         elif format == "html":
-            reporter = HTMLReporter()
-            output_file = output or str(Path(run_dir.name) / "report.html")
-            report_path = reporter.report(processed_data, output_file)
-            console.print(f"[green]HTML report saved to: {str(run_dir / 'report.html')}[/green]")
+            report_path = _write_html_report(processed_data, run_dir, output)
+            console.print(f"[green]HTML report saved to: {report_path}[/green]")
         elif format == "json":
             output_path = Path(output) if output else (run_dir / "result.json")
-            write_json(output_path, {"test_result": test_result})
+            write_bytes(output_path, raw_payload)
             console.print(f"[green]JSON results saved to: {str(output_path)}[/green]")
 
         console.print(f"[green]Artifacts saved to: {str(run_dir)}[/green]")
@@ -184,28 +329,31 @@ def run(ctx, executor_type, engine_name, test_name, iterations, warmup_iteration
 @cli.command()
 @click.argument("engines", nargs=-1, required=True)
 @click.argument("test_name")
-@click.option("--executor-type", "-e", type=_executor_choice(), default="cri", help="Executor type")
+@click.option("--executor-type", "-e", type=_EXECUTOR_CHOICE, default="cri", help="Executor type")
 @click.option("--iterations", "-i", type=int, help="Number of test iterations per engine")
 @click.option("--warmup-iterations", type=int, help="Number of warmup iterations (set 0 to disable warmup)")
+@click.option("--parallel", type=int, default=1, show_default=True,
+              help="Max engines tested concurrently (1 = sequential, 0 = all engines at once)")
 @click.option("--output", "-o", type=click.Path(), help="Output file for comparison report")
 @click.option("--format", "-f", type=click.Choice(["console", "html"]), default="console", help="Output format")
 @click.pass_context
-def compare(ctx, engines, test_name, executor_type, iterations, warmup_iterations, output, format):
+def compare(ctx, engines, test_name, executor_type, iterations, warmup_iterations, parallel, output, format):
     """Compare performance across different engines"""
+    from core.envinfo import collect_env_info_async
+    from processor import DataAnalyzer
+    from reporter import ConsoleReporter
+
     config = ctx.obj["config"]
 
     try:
         console.print(f"[bold blue]Comparing {test_name} across engines: {', '.join(engines)}[/bold blue]")
 
-        test_results = []
+        jobs = []
+        cri_eps = {}
         for engine_name in engines:
-            console.print(f"[dim]Testing {engine_name}...[/dim]")
-
-            if executor_type == "cri" and engine_name == "docker":
-                console.print("[yellow]Skip docker in CRI mode (docker is not a CRI runtime)[/yellow]")
-                continue
-            if executor_type == "client" and engine_name in ("crio", "containerd"):
-                console.print(f"[yellow]Skip {engine_name} in client mode (no client interface)[/yellow]")
+            reason = _incompatible(executor_type, engine_name)
+            if reason:
+                console.print(f"[yellow]Skip {engine_name} in {executor_type} mode ({reason})[/yellow]")
                 continue
 
             test_config = config.get_test_config(test_name)
@@ -215,11 +363,21 @@ def compare(ctx, engines, test_name, executor_type, iterations, warmup_iteration
                 test_config.warmup_iterations = warmup_iterations
 
             engine_cfg = config.get_engine_config(engine_name)
+            if executor_type == "cri":
+                cri_eps[engine_name] = engine_cfg.endpoint
             engine = create_engine(engine_name, engine_cfg)
             executor = create_executor(executor_type, engine, test_config)
+            jobs.append((engine_name, executor))
 
-            test_result = run_async(executor.run_test(test_name))
-            test_results.append(test_result)
+        def _job(engine_name, executor):
+            banner = Text(f"Testing {engine_name}...", style="dim")
+
+            async def _run():
+                console.print(banner)
+                return await executor.run_test(test_name)
+            return _run
+
+        test_results = list(run_async(_gather_limited([_job(n, ex) for n, ex in jobs], parallel)))
 
         analyzer = DataAnalyzer(baseline_engine="isulad")
         analyzer.set_metadata(
@@ -231,16 +389,10 @@ def compare(ctx, engines, test_name, executor_type, iterations, warmup_iteration
                 "test_name": test_name,
                 "iterations": iterations,
                 "warmup_iterations": warmup_iterations,
+                "parallel": parallel,
             },
         )
-        cri_eps = {}
-        if executor_type == "cri":
-            for r in test_results:
-                try:
-                    cri_eps[r.engine_name] = config.get_engine_config(r.engine_name).endpoint
-                except Exception:
-                    pass
-        analyzer.set_metadata("env", collect_env_info(engines=list(engines), cri_endpoints=cri_eps))
+        analyzer.set_metadata("env", run_async(collect_env_info_async(engines=list(engines), cri_endpoints=cri_eps)))
         processed_data = analyzer.process(test_results)
 
         report_cfg = config.get_report_config()
@@ -260,10 +412,8 @@ def compare(ctx, engines, test_name, executor_type, iterations, warmup_iteration
             else:
                 reporter.report(processed_data)
         elif format == "html":
-            reporter = HTMLReporter()
-            output_file = output or str(Path(run_dir.name) / "report.html")
-            report_path = reporter.report(processed_data, output_file)
-            console.print(f"[green]HTML comparison report saved to: {str(run_dir / 'report.html')}[/green]")
+            report_path = _write_html_report(processed_data, run_dir, output)
+            console.print(f"[green]HTML comparison report saved to: {report_path}[/green]")
 
         console.print(f"[green]Artifacts saved to: {str(run_dir)}[/green]")
 
@@ -275,87 +425,92 @@ def compare(ctx, engines, test_name, executor_type, iterations, warmup_iteration
 
 @cli.command()
 @click.argument("engines", nargs=-1, required=True)
-@click.option("--executor-type", "-e", type=_executor_choice(), default="cri", help="Executor type")
+@click.option("--executor-type", "-e", type=_EXECUTOR_CHOICE, default="cri", help="Executor type")
 @click.option(
     "--suite",
-    type=click.Choice(
-        ["standard", "standard_offline", "extended", "extended_offline", "client", "client_offline", "client_extended"]
-    ),
+    type=click.Choice(list(_BENCH_SUITES)),
     help="Benchmark suite name (defaults: cri->standard, client->client)",
 )
 @click.option("--iterations", "-i", type=int, help="Override iterations for all tests")
 @click.option("--warmup-iterations", type=int, help="Override warmup iterations for all tests (set 0 to disable warmup)")
 @click.option("--concurrency-levels", type=str, help='Comma-separated concurrency levels (e.g. "1,2,4,8")')
+@click.option("--parallel", type=int, default=1, show_default=True,
+              help="Max (test, engine, concurrency) runs in flight (1 = sequential, 0 = unbounded)")
 @click.option("--output", "-o", type=click.Path(), help="Output file for benchmark report")
 @click.option("--format", "-f", type=click.Choice(["console", "html"]), default="html", help="Output format")
 @click.pass_context
-def bench(ctx, engines, executor_type, suite, iterations, warmup_iterations, concurrency_levels, output, format):
+def bench(ctx, engines, executor_type, suite, iterations, warmup_iterations, concurrency_levels, parallel, output,
+          format):
     """Run a benchmark suite across engines and generate a report"""
+    from core.envinfo import collect_env_info_async
+    from processor import DataAnalyzer
+    from reporter import ConsoleReporter
+
     config = ctx.obj["config"]
 
     try:
         if suite is None:
             suite = "client_offline" if executor_type == "client" else "standard_offline"
 
-        tests = config.get(f"benchmarks.{suite}_tests", [])
+        tests = config.get_path(_BENCH_TEST_KEYS[suite], [])
         if not tests:
             raise ValueError(f"No tests configured for suite '{suite}'. Check config: benchmarks.{suite}_tests")
 
         console.print(f"[bold blue]Benchmark suite '{suite}' ({executor_type}) on engines: {', '.join(engines)}[/bold blue]")
 
-        test_results = []
+        # Optional concurrency sweep (same for every test/engine, so parse it once)
+        levels_override = _parse_concurrency_levels(concurrency_levels) if concurrency_levels else None
 
+        # Compatibility only depends on (executor_type, engine): decide once, not per test.
+        # Engine configs (and CRI endpoints for env info) are looked up in the same pass.
+        # Executors only read engine.config / engine type, so one engine instance serves every test and level.
+        engines_run = {}
+        cri_eps = {}
+        for engine_name in engines:
+            reason = _incompatible(executor_type, engine_name)
+            if reason:
+                console.print(f"[yellow]Skip all tests on {engine_name} ({reason})[/yellow]")
+                continue
+            engine_cfg = config.get_engine_config(engine_name)
+            engines_run[engine_name] = create_engine(engine_name, engine_cfg)
+            if executor_type == "cri":
+                cri_eps[engine_name] = engine_cfg.endpoint
+
+        # Created up front so each result can be pre-packed as soon as its job finishes.
+        analyzer = DataAnalyzer(baseline_engine="isulad")
+
+        jobs = []
+
+        # Every level below is a copy of the per-test config, so the sweep never shares state.
         for test_name in tests:
-            for engine_name in engines:
-                if executor_type == "cri" and engine_name == "docker":
-                    console.print(f"[yellow]Skip {test_name} on docker (docker is not a CRI runtime)[/yellow]")
-                    continue
-                if executor_type == "client" and engine_name in ("crio", "containerd"):
-                    console.print(f"[yellow]Skip {test_name} on {engine_name} (no client mode)[/yellow]")
-                    continue
-
-                console.print(f"[dim]Running {test_name} on {engine_name}...[/dim]")
-
-                base_test_config = config.get_test_config(test_name)
-                if iterations:
-                    base_test_config.iterations = iterations
-                if warmup_iterations is not None:
-                    base_test_config.warmup_iterations = warmup_iterations
-
-                # Optional concurrency sweep
-                if concurrency_levels:
-                    levels = []
-                    for part in concurrency_levels.split(","):
-                        part = part.strip()
-                        if not part:
-                            continue
-                        try:
-                            v = int(part)
-                            if v > 0:
-                                levels.append(v)
-                        except Exception:
-                            continue
-                    if not levels:
-                        raise ValueError("Invalid --concurrency-levels. Example: --concurrency-levels 1,2,4,8")
-                else:
-                    levels = [int(getattr(base_test_config, "concurrency", 1) or 1)]
+            base_test_config = config.get_test_config(test_name)
+            if iterations:
+                base_test_config.iterations = iterations
+            if warmup_iterations is not None:
+                base_test_config.warmup_iterations = warmup_iterations
 
+            levels = levels_override or [int(getattr(base_test_config, "concurrency", 1) or 1)]
+            for engine_name, engine in engines_run.items():
+                # Executors keep per-run state (created resources, tmpdirs), so each level still gets its own.
                 for c in levels:
-                    test_config = config.get_test_config(test_name)
-                    if iterations:
-                        test_config.iterations = iterations
-                    if warmup_iterations is not None:
-                        test_config.warmup_iterations = warmup_iterations
-                    test_config.concurrency = c
-
-                    engine_cfg = config.get_engine_config(engine_name)
-                    engine = create_engine(engine_name, engine_cfg)
+                    test_config = replace(base_test_config, concurrency=c)
                     executor = create_executor(executor_type, engine, test_config)
+                    jobs.append((test_name, engine_name, executor))
 
-                    test_result = run_async(executor.run_test(test_name))
-                    test_results.append(test_result)
+        def _job(test_name, engine_name, executor):
+            banner = Text(f"Running {test_name} on {engine_name} (concurrency={executor.config.concurrency})...",
+                          style="dim")
+
+            async def _run():
+                console.print(banner)
+                result = await executor.run_test(test_name)
+                analyzer.prepare(result)
+                return result
+            return _run
+
+        # Results come back in job order, i.e. the same (test, engine, level) order as the sequential loop.
+        test_results = list(run_async(_gather_limited([_job(t, e, ex) for t, e, ex in jobs], parallel)))
 
-        analyzer = DataAnalyzer(baseline_engine="isulad")
         analyzer.set_metadata(
             "run_config",
             {
@@ -366,16 +521,10 @@ def bench(ctx, engines, executor_type, suite, iterations, warmup_iterations, con
                 "iterations": iterations,
                 "warmup_iterations": warmup_iterations,
                 "concurrency_levels": concurrency_levels,
+                "parallel": parallel,
             },
         )
-        cri_eps = {}
-        if executor_type == "cri":
-            for e in engines:
-                try:
-                    cri_eps[str(e)] = config.get_engine_config(str(e)).endpoint
-                except Exception:
-                    pass
-        analyzer.set_metadata("env", collect_env_info(engines=list(engines), cri_endpoints=cri_eps))
+        analyzer.set_metadata("env", run_async(collect_env_info_async(engines=list(engines), cri_endpoints=cri_eps)))
         processed_data = analyzer.process(test_results)
 
         report_cfg = config.get_report_config()
@@ -395,10 +544,8 @@ def bench(ctx, engines, executor_type, suite, iterations, warmup_iterations, con
             else:
                 reporter.report(processed_data)
         else:
-            reporter = HTMLReporter()
-            output_file = output or str(Path(run_dir.name) / "report.html")
-            report_path = reporter.report(processed_data, output_file)
-            console.print(f"[green]HTML benchmark report saved to: {str(run_dir / 'report.html')}[/green]")
+            report_path = _write_html_report(processed_data, run_dir, output)
+            console.print(f"[green]HTML benchmark report saved to: {report_path}[/green]")
 
         console.print(f"[green]Artifacts saved to: {str(run_dir)}[/green]")
 
@@ -409,8 +556,8 @@ def bench(ctx, engines, executor_type, suite, iterations, warmup_iterations, con
 
 
 @cli.command()
-@click.argument("engine_name", type=_engine_choice())
-@click.option("--executor-type", "-e", type=_executor_choice(), default="cri", help="Executor type")
+@click.argument("engine_name", type=_ENGINE_CHOICE)
+@click.option("--executor-type", "-e", type=_EXECUTOR_CHOICE, default="cri", help="Executor type")
 @click.pass_context
 def health(ctx, engine_name, executor_type):
     """Check engine health and connectivity"""
@@ -419,10 +566,8 @@ def health(ctx, engine_name, executor_type):
     try:
         console.print(f"[bold blue]Checking health of {engine_name} engine...[/bold blue]")
 
-        if executor_type == "cri" and engine_name == "docker":
-            raise ValueError("docker不是CRI运行时，不能使用CRI模式（请用 client 模式或选择 isulad/crio/containerd）")
-        if executor_type == "client" and engine_name in ("crio", "containerd"):
-            raise ValueError("crio/containerd 不支持 client 模式（请用 cri 模式或选择 isulad/docker）")
+        if _incompatible(executor_type, engine_name):
+            raise ValueError(_MODE_ERRORS[executor_type])
 
         engine_cfg = config.get_engine_config(engine_name)
         engine = create_engine(engine_name, engine_cfg)
@@ -445,7 +590,7 @@ def health(ctx, engine_name, executor_type):
 def list_engines_cmd():
     """List available container engines"""
     console.print("[bold blue]Available Container Engines:[/bold blue]")
-    for name in sorted(list_engines_registry().keys()):
+    for name in _ENGINE_NAMES:
         console.print(f"• {name}")
 
 
@@ -453,7 +598,7 @@ def list_engines_cmd():
 def list_executors_cmd():
     """List available executors"""
     console.print("[bold blue]Available Executors:[/bold blue]")
-    for name in sorted(list_executors_registry().keys()):
+    for name in _EXECUTOR_NAMES:
         console.print(f"• {name}")
 
 
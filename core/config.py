@@ -2,14 +2,27 @@
 Configuration management for iSulad Performance Testing Framework
 """
 
+import copy
+import hashlib
+import json
 import os
+import sys
 import yaml
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional
 from dataclasses import dataclass
 from pathlib import Path
 
+# libyaml-backed loader when PyYAML was built with it; same semantics as yaml.safe_load.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
-@dataclass
+# dataclass(slots=True) 需要 Python 3.10+，更早版本退回普通 dataclass
+_DATACLASS_OPTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTS)
 class EngineConfig:
     """引擎配置"""
     name: str
@@ -17,9 +30,11 @@ class EngineConfig:
     timeout: int = 30
     retries: int = 3
     version: str = "latest"
+    # gRPC 引擎的初始 channel 池大小（单条 HTTP/2 连接约 100 个并发 stream 上限）；并发运行时引擎会按实际并发度扩充
+    channels: int = 1
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class TestConfig:
     """测试配置"""
     name: str
@@ -35,11 +50,11 @@ class TestConfig:
     cri_host_network: bool = True
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class ReportConfig:
     """报告配置"""
     output_dir: str = "./results"
-    formats: list = None
+    formats: Optional[list] = None
     include_charts: bool = True
     include_raw_data: bool = False
 
@@ -54,6 +69,10 @@ class Config:
     def __init__(self, config_file: Optional[str] = None):
         self.config_file = config_file or self._find_config_file()
         self._config: Dict[str, Any] = {}
+        # get_*_config 结果缓存，set() 时整体失效
+        self._memo: Dict[tuple, Any] = {}
+        # 点分键 -> 值 的扁平索引（首次 get 时构建，set() 时失效）
+        self._flat: Optional[Dict[str, Any]] = None
         self._load_config()
 
     def _find_config_file(self) -> str:
@@ -72,12 +91,59 @@ class Config:
         # 如果都没有找到，使用默认配置
         return str(Path(__file__).parent.parent / "config" / "default.yaml")
 
+    def _cache_path(self) -> Path:
+        """解析结果缓存文件路径（按配置文件绝对路径区分，存放在用户缓存目录）"""
+        digest = hashlib.sha1(os.path.abspath(self.config_file).encode("utf-8")).hexdigest()[:16]
+        cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+        return Path(cache_home) / "isulad-perf" / f"config-{digest}.json"
+
+    def _load_cached_config(self, st: os.stat_result) -> Optional[Dict[str, Any]]:
+        """
+        读取与配置文件 mtime/size 一致的缓存；未命中或损坏返回 None。
+
+        缓存为 JSON（不反序列化任意对象）；且只信任当前 euid 所有、组/其他用户不可写的文件，
+        避免 sudo -E 下 root 读到普通用户可改写的缓存。
+        """
+        try:
+            with open(self._cache_path(), 'rb') as f:
+                cst = os.fstat(f.fileno())
+                if cst.st_uid != os.geteuid() or cst.st_mode & 0o022:
+                    return None
+                cached = json.loads(f.read())
+            if cached.get("mtime_ns") == st.st_mtime_ns and cached.get("size") == st.st_size:
+                return cached["config"]
+        except Exception:
+            pass
+        return None
+
+    def _store_cached_config(self, st: os.stat_result):
+        """写入解析结果缓存（best-effort，失败忽略；含 JSON 无法原样表示的值时不缓存）"""
+        try:
+            payload = json.dumps({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "config": self._config})
+            if json.loads(payload)["config"] != self._config:
+                return
+            cache_path = self._cache_path()
+            cache_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp, cache_path)
+        except Exception:
+            pass
+
     def _load_config(self):
-        """加载配置文件"""
+        """加载配置文件（YAML 未变化时直接复用缓存的解析结果）"""
         try:
             if os.path.exists(self.config_file):
+                st = os.stat(self.config_file)
+                cached = self._load_cached_config(st)
+                if cached is not None:
+                    self._config = cached
+                    return
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    self._config = yaml.safe_load(f) or {}
+                    self._config = yaml.load(f, Loader=_YamlLoader) or {}
+                self._store_cached_config(st)
             else:
                 self._config = self._get_default_config()
         except Exception as e:
@@ -129,19 +195,33 @@ class Config:
             }
         }
 
+    def _memoized(self, key: tuple, build: Callable[[], Any]) -> Any:
+        """返回缓存的配置对象副本（调用方会就地修改 TestConfig 等字段）"""
+        cached = self._memo.get(key)
+        if cached is None:
+            cached = self._memo[key] = build()
+        return copy.copy(cached)
+
     def get_engine_config(self, engine_name: str) -> EngineConfig:
         """获取引擎配置"""
+        return self._memoized(("engine", engine_name), lambda: self._build_engine_config(engine_name))
+
+    def _build_engine_config(self, engine_name: str) -> EngineConfig:
         engine_cfg = self._config.get("engines", {}).get(engine_name, {})
         return EngineConfig(
             name=engine_name,
             endpoint=engine_cfg.get("endpoint", ""),
             timeout=engine_cfg.get("timeout", 30),
             retries=engine_cfg.get("retries", 3),
-            version=engine_cfg.get("version", "latest")
+            version=engine_cfg.get("version", "latest"),
+            channels=max(int(engine_cfg.get("channels") or 1), 1),
         )
 
     def get_test_config(self, test_name: str = "default") -> TestConfig:
         """获取测试配置"""
+        return self._memoized(("test", test_name), lambda: self._build_test_config(test_name))
+
+    def _build_test_config(self, test_name: str) -> TestConfig:
         tests_cfg = self._config.get("tests", {}) or {}
         # 默认值
         base = {
@@ -170,6 +250,11 @@ class Config:
 
     def get_report_config(self) -> ReportConfig:
         """获取报告配置"""
+        report_config = self._memoized(("report",), self._build_report_config)
+        report_config.formats = list(report_config.formats)
+        return report_config
+
+    def _build_report_config(self) -> ReportConfig:
         report_cfg = self._config.get("report", {})
         return ReportConfig(
             output_dir=report_cfg.get("output_dir", "./results"),
@@ -185,15 +270,35 @@ class Config:
             "file": "isulad-perf.log"
         })
 
+    @staticmethod
+    def _flatten(node: Dict[str, Any], prefix: tuple = ()):
+        """递归产出 (键路径元组, 值)，中间层的 dict 本身也会产出"""
+        for k, v in node.items():
+            if not isinstance(k, str):
+                continue
+            path = prefix + (k,)
+            yield path, v
+            if isinstance(v, dict):
+                yield from Config._flatten(v, path)
+
+    def _flat_index(self) -> Dict[Any, Any]:
+        """扁平索引：同时以 "a.b" 与 ("a", "b") 为键"""
+        if self._flat is None:
+            flat = {}
+            for path, v in self._flatten(self._config):
+                flat[path] = v
+                flat[".".join(path)] = v
+            self._flat = flat
+        return self._flat
+
     def get(self, key: str, default: Any = None) -> Any:
-        """获取配置项"""
-        keys = key.split('.')
-        value = self._config
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                return default
+        """获取配置项（点分键，单次哈希查找）"""
+        value = self._flat_index().get(key)
+        return value if value is not None else default
+
+    def get_path(self, path: tuple, default: Any = None) -> Any:
+        """按预先拆分好的键路径获取配置项，如 ("benchmarks", "standard_tests")"""
+        value = self._flat_index().get(tuple(path))
         return value if value is not None else default
 
     def set(self, key: str, value: Any):
@@ -205,6 +310,8 @@ class Config:
                 config[k] = {}
             config = config[k]
         config[keys[-1]] = value
+        self._memo.clear()
+        self._flat = None
 
     def save(self, file_path: Optional[str] = None):
         """保存配置到文件"""
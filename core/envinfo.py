@@ -7,48 +7,145 @@ We only use stdlib + best-effort subprocess calls (timeouts, ignore failures).
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import os
 import platform
+import re
 import shutil
-import subprocess
+import threading
 import time
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 
+_BINARIES = ("isulad", "isula", "docker", "containerd", "ctr", "crictl", "crio", "runc", "podman")
 
-def _run(cmd: List[str], timeout: int = 2) -> str:
+# binary -> version commands tried in order (first non-empty output wins); binaries absent here get no probe
+_VERSION_PROBES: Dict[str, Tuple[List[str], ...]] = {
+    **{b: ([b, "--version"], [b, "version"]) for b in ("docker", "podman", "crictl", "runc", "containerd", "crio")},
+    "isula": (["isula", "version"],),
+    "isulad": (["isulad", "--version"], ["isulad", "-v"]),
+}
+
+# KEY=VALUE lines of /etc/os-release; surrounding double quotes are dropped from the value.
+_OS_RELEASE_RE = re.compile(r'^[ \t]*([A-Za-z_][A-Za-z0-9_]*)=[ \t]*"*(.*?)"*[ \t\r]*$', re.M)
+
+# Memoized fingerprints per (engines, cri_endpoints): key -> (monotonic time collected, info).
+# Entries older than _ENV_CACHE_TTL seconds are collected again (`which` lookups included).
+_ENV_CACHE_TTL = 300.0
+_ENV_CACHE: Dict[Tuple[tuple, tuple], Tuple[float, Dict[str, Any]]] = {}
+_ENV_CACHE_LOCK = threading.Lock()
+
+
+async def _run_async(cmd: List[str], timeout: int = 2) -> str:
+    # An absolute executable path plus close_fds=False lets CPython spawn via posix_spawn instead of
+    # fork+exec (our fds are non-inheritable per PEP 446, so nothing leaks into the probe).
+    exe = cmd[0] if os.path.isabs(cmd[0]) else _which(cmd[0])
+    if not exe:
+        return ""
     try:
-        p = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            timeout=timeout,
-            check=False,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
+        p = await asyncio.create_subprocess_exec(
+            exe,
+            *cmd[1:],
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            close_fds=False,
         )
-        return (p.stdout or "").strip()
     except Exception:
         return ""
+    try:
+        out, _ = await asyncio.wait_for(p.communicate(), timeout=timeout)
+    except Exception:
+        try:
+            p.kill()
+        except ProcessLookupError:
+            pass
+        await p.wait()
+        return ""
+    return (out or b"").decode("utf-8", errors="replace").strip()
+
 
+async def _first_output(*cmds: List[str], timeout: int = 2) -> str:
+    """Try fallback commands in order (e.g. `--version` then `version`), first non-empty output wins."""
+    for cmd in cmds:
+        out = await _run_async(cmd, timeout=timeout)
+        if out:
+            return out
+    return ""
 
+
+@lru_cache(maxsize=256)
 def _which(name: str) -> Optional[str]:
     return shutil.which(name)
 
 
-def collect_env_info(
+def _cache_get(key: Tuple[tuple, tuple]) -> Optional[Dict[str, Any]]:
+    with _ENV_CACHE_LOCK:
+        hit = _ENV_CACHE.get(key)
+    if hit is None or time.monotonic() - hit[0] >= _ENV_CACHE_TTL:
+        return None
+    return copy.deepcopy(hit[1])
+
+
+def _cache_put(key: Tuple[tuple, tuple], info: Dict[str, Any]):
+    with _ENV_CACHE_LOCK:
+        _ENV_CACHE[key] = (time.monotonic(), info)
+
+
+def cache_clear():
+    """Drop memoized fingerprints and `which` lookups (e.g. after installing a runtime, or in tests)."""
+    with _ENV_CACHE_LOCK:
+        _ENV_CACHE.clear()
+    _which.cache_clear()
+
+
+def _cache_key(engines: Optional[List[str]], cri_endpoints: Optional[Dict[str, str]]) -> Tuple[tuple, tuple]:
+    engines_key = tuple(str(e) for e in (engines or []))
+    eps_key = tuple(sorted((str(k), str(v)) for k, v in (cri_endpoints or {}).items()))
+    return engines_key, eps_key
+
+
+async def collect_env_info_async(
     engines: Optional[List[str]] = None,
     cri_endpoints: Optional[Dict[str, str]] = None,
 ) -> Dict[str, Any]:
     """
-    Collect a lightweight environment fingerprint.
+    Collect a lightweight environment fingerprint; all subprocess probes run concurrently.
 
     - engines: list like ["isulad","containerd","crio"]
     - cri_endpoints: map engine->endpoint for CRI engines (for crictl version probing)
+
+    Results are memoized per (engines, cri_endpoints) for _ENV_CACHE_TTL seconds;
+    callers get a private copy.
     """
-    engines = engines or []
-    cri_endpoints = cri_endpoints or {}
+    key = _cache_key(engines, cri_endpoints)
+    cached = _cache_get(key)
+    if cached is not None:
+        return cached
+    # Re-collecting (first call or TTL expired): re-resolve binaries too, PATH may have changed since.
+    _which.cache_clear()
+    info = await _collect_env_info(list(key[0]), dict(key[1]))
+    _cache_put(key, info)
+    return copy.deepcopy(info)
+
+
+def collect_env_info(
+    engines: Optional[List[str]] = None,
+    cri_endpoints: Optional[Dict[str, str]] = None,
+) -> Dict[str, Any]:
+    """Synchronous wrapper of collect_env_info_async (runs on a private event loop)."""
+    cached = _cache_get(_cache_key(engines, cri_endpoints))
+    if cached is not None:
+        return cached
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(collect_env_info_async(engines, cri_endpoints))
+    finally:
+        loop.close()
 
+
+async def _collect_env_info(engines: List[str], cri_endpoints: Dict[str, str]) -> Dict[str, Any]:
     info: Dict[str, Any] = {
         "timestamp": int(time.time()),
         "platform": {
@@ -69,70 +166,48 @@ def collect_env_info(
         "engines": {},
     }
 
-    # /etc/os-release (best-effort)
+    # /etc/os-release (best-effort): one read + one regex pass
     try:
-        if os.path.exists("/etc/os-release"):
-            kv = {}
-            with open("/etc/os-release", "r", encoding="utf-8", errors="replace") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line or "=" not in line:
-                        continue
-                    k, v = line.split("=", 1)
-                    kv[k] = v.strip().strip('"')
-            info["os_release"] = kv
+        with open("/etc/os-release", "r", encoding="utf-8", errors="replace") as f:
+            info["os_release"] = dict(_OS_RELEASE_RE.findall(f.read()))
     except Exception:
         pass
 
-    # Hardware summaries (best-effort)
-    lscpu = _run(["lscpu"], timeout=2)
-    if lscpu:
-        info["hardware"]["lscpu"] = lscpu
-    freeh = _run(["free", "-h"], timeout=2)
-    if freeh:
-        info["hardware"]["free_h"] = freeh
-    uname = _run(["uname", "-a"], timeout=2)
-    if uname:
-        info["hardware"]["uname_a"] = uname
-
-    # Disk (best-effort)
-    dfh = _run(["df", "-h", "/"], timeout=2)
-    if dfh:
-        info["disk"]["df_root_h"] = dfh
-
-    # Common binaries
-    for b in ["isulad", "isula", "docker", "containerd", "ctr", "crictl", "crio", "runc", "podman"]:
+    # Every probe below is independent: collect (target dict, key, coroutine) and await them together,
+    # so the total wait is the slowest probe rather than the sum. Results are stitched back in this order.
+    probes: List[Tuple[Dict[str, Any], str, Awaitable[str]]] = []
+
+    # Hardware summaries / disk (best-effort)
+    probes.append((info["hardware"], "lscpu", _run_async(["lscpu"], timeout=2)))
+    probes.append((info["hardware"], "free_h", _run_async(["free", "-h"], timeout=2)))
+    probes.append((info["hardware"], "uname_a", _run_async(["uname", "-a"], timeout=2)))
+    probes.append((info["disk"], "df_root_h", _run_async(["df", "-h", "/"], timeout=2)))
+
+    # Common binaries + version probes (fast, best-effort)
+    for b in _BINARIES:
         path = _which(b)
         if not path:
             continue
-        info["binaries"][b] = {"path": path}
-        # version probes (fast, best-effort)
-        if b in ("docker", "podman", "crictl", "runc", "containerd", "crio"):
-            out = _run([b, "--version"], timeout=2) or _run([b, "version"], timeout=2)
-            if out:
-                info["binaries"][b]["version"] = out
-        if b == "isula":
-            out = _run(["isula", "version"], timeout=2)
-            if out:
-                info["binaries"][b]["version"] = out
-        if b == "isulad":
-            out = _run(["isulad", "--version"], timeout=2) or _run(["isulad", "-v"], timeout=2)
-            if out:
-                info["binaries"][b]["version"] = out
+        entry = info["binaries"][b] = {"path": path}
+        cmds = _VERSION_PROBES.get(b)
+        if cmds:
+            probes.append((entry, "version", _first_output(*cmds, timeout=2)))
 
     # Engine-specific best-effort probes
+    has_crictl = bool(_which("crictl"))
     for e in engines:
         e = str(e)
-        info["engines"][e] = {}
+        entry = info["engines"][e] = {}
         ep = cri_endpoints.get(e)
         if ep:
-            info["engines"][e]["cri_endpoint"] = ep
+            entry["cri_endpoint"] = ep
             # Try to get runtime version via crictl against that endpoint
-            if _which("crictl"):
-                out = _run(["crictl", "-r", ep, "--timeout", "3s", "version"], timeout=4)
-                if out:
-                    info["engines"][e]["crictl_version"] = out
-
-    return info
+            if has_crictl:
+                probes.append((entry, "crictl_version", _run_async(["crictl", "-r", ep, "--timeout", "3s", "version"], timeout=4)))
 
+    outs = await asyncio.gather(*[coro for _, _, coro in probes])
+    for (target, key, _), out in zip(probes, outs):
+        if out:
+            target[key] = out
 
+    return info
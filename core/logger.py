@@ -2,11 +2,53 @@
 Logging configuration for iSulad Performance Testing Framework
 """
 
+import atexit
+import queue
 import sys
 import logging
+import logging.handlers
 from pathlib import Path
-from typing import Optional
-from loguru import logger
+from typing import Optional, Union
+
+# 框架日志的根 logger；get_logger(name) 返回其子 logger，第三方库（docker/urllib3/grpc）的日志不混入
+_ROOT_NAME = "isulad-perf"
+
+_FORMAT = "%(asctime)s | %(levelname)-8s | %(name)s:%(funcName)s:%(lineno)d - %(message)s"
+_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+_SIZE_UNITS = {"B": 1, "KB": 1024, "MB": 1024 ** 2, "GB": 1024 ** 3}
+
+logger = logging.getLogger(_ROOT_NAME)
+
+# 实际的 stdout/文件写入在后台线程完成，调用方只做一次入队
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _ColorFormatter(logging.Formatter):
+    """终端输出按级别着色"""
+
+    _COLORS = {
+        logging.DEBUG: "\033[34m",
+        logging.INFO: "\033[1m",
+        logging.WARNING: "\033[33m",
+        logging.ERROR: "\033[31m",
+        logging.CRITICAL: "\033[41m",
+    }
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        color = self._COLORS.get(record.levelno)
+        return f"{color}{text}\033[0m" if color else text
+
+
+def _parse_size(size: Union[str, int, None]) -> int:
+    """解析 "10MB" / "512 KB" / 1048576 形式的大小（字节）"""
+    if isinstance(size, int):
+        return size
+    text = str(size or "10MB").strip().upper().replace(" ", "")
+    for unit in ("GB", "MB", "KB", "B"):
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * _SIZE_UNITS[unit])
+    return int(float(text))
 
 
 def setup_logging(config: Optional[dict] = None):
@@ -19,33 +61,62 @@ def setup_logging(config: Optional[dict] = None):
             "backup_count": 5
         }
 
-    # 移除默认处理器
-    logger.remove()
+    global _listener
+
+    level = str(config.get("level", "INFO")).upper()
 
-    # 控制台输出
-    logger.add(
-        sys.stdout,
-        level=config.get("level", "INFO"),
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
-        colorize=True
-    )
+    # 移除已有处理器（可重复调用）
+    _stop_listener()
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+        handler.close()
+    logger.setLevel(level)
+    logger.propagate = False
 
-    # 文件输出
+    # 控制台输出（仅 TTY 着色）
+    console = logging.StreamHandler(sys.stdout)
+    formatter_cls = _ColorFormatter if sys.stdout.isatty() else logging.Formatter
+    console.setFormatter(formatter_cls(_FORMAT, _DATE_FORMAT))
+    handlers = [console]
+
+    # 文件输出（按大小轮转）
     log_file = config.get("file", "isulad-perf.log")
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        logger.add(
+        file_handler = logging.handlers.RotatingFileHandler(
             log_file,
-            level=config.get("level", "INFO"),
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level: <8} | {name}:{function}:{line} - {message}",
-            rotation=config.get("max_size", "10MB"),
-            retention=config.get("backup_count", 5),
-            encoding="utf-8"
+            maxBytes=_parse_size(config.get("max_size", "10MB")),
+            backupCount=int(config.get("backup_count", 5)),
+            encoding="utf-8",
         )
+        file_handler.setFormatter(logging.Formatter(_FORMAT, _DATE_FORMAT))
+        handlers.append(file_handler)
+
+    # 业务线程/事件循环只把记录放入队列，格式化与 I/O 由 QueueListener 线程完成，不计入被测操作耗时
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+
+
+def _stop_listener():
+    """停止后台日志线程（刷出队列中剩余记录）并关闭其处理器"""
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(_stop_listener)
 
 
-def get_logger(name: str = "isulad-perf"):
+def get_logger(name: str = _ROOT_NAME) -> logging.Logger:
     """获取日志器"""
-    return logger.bind(name=name)
+    if not name or name == _ROOT_NAME:
+        return logger
+    return logger.getChild(name)
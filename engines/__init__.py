@@ -2,10 +2,49 @@
 Container engine adapters for iSulad Performance Testing Framework
 """
 
+import importlib
+from typing import Dict, Tuple, Type
+
+from core.config import EngineConfig
+from core.exceptions import EngineError
 from .base import BaseEngine, EngineType
-from .isulad import ISuladEngine
-from .docker import DockerEngine
-from .crio import CRIoEngine
-from .containerd import ContainerdEngine
 
-__all__ = ['BaseEngine', 'EngineType', 'ISuladEngine', 'DockerEngine', 'CRIoEngine', 'ContainerdEngine']
+# 引擎注册表：名称 -> (模块, 类名)，适配器模块在首次使用时才导入
+_ENGINE_REGISTRY: Dict[str, Tuple[str, str]] = {
+    EngineType.ISULAD.value: (".isulad", "ISuladEngine"),
+    EngineType.DOCKER.value: (".docker", "DockerEngine"),
+    EngineType.CRIO.value: (".crio", "CRIoEngine"),
+    EngineType.CONTAINERD.value: (".containerd", "ContainerdEngine"),
+}
+_ENGINE_CLASSES = {cls_name: (mod, cls_name) for mod, cls_name in _ENGINE_REGISTRY.values()}
+
+
+def _load_engine_class(module: str, cls_name: str) -> Type[BaseEngine]:
+    return getattr(importlib.import_module(module, __name__), cls_name)
+
+
+def __getattr__(name: str):
+    # Keep `from engines import DockerEngine` working without importing every adapter up front.
+    if name in _ENGINE_CLASSES:
+        return _load_engine_class(*_ENGINE_CLASSES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def list_engines() -> Dict[str, str]:
+    """列出已注册的引擎（名称 -> 适配器类名）"""
+    return {name: cls_name for name, (_, cls_name) in _ENGINE_REGISTRY.items()}
+
+
+def create_engine(name: str, config: EngineConfig) -> BaseEngine:
+    """按名称创建引擎实例"""
+    try:
+        module, cls_name = _ENGINE_REGISTRY[str(name).lower()]
+    except KeyError:
+        raise EngineError(f"Unsupported engine: {name}")
+    return _load_engine_class(module, cls_name)(config)
+
+
+__all__ = [
+    'BaseEngine', 'EngineType', 'ISuladEngine', 'DockerEngine', 'CRIoEngine', 'ContainerdEngine',
+    'list_engines', 'create_engine',
+]
@@ -3,13 +3,18 @@ Base engine interface for container engines
 """
 
 import abc
-from typing import Dict, Any, Optional, List
+import sys
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
 from core.config import EngineConfig
 from core.exceptions import EngineError, ConnectionError
 
+# 高频创建的结果对象：Python 3.10+ 使用 slots，去掉实例 __dict__
+_DATACLASS_OPTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class EngineType(Enum):
     """引擎类型枚举"""
@@ -19,7 +24,7 @@ class EngineType(Enum):
     CONTAINERD = "containerd"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class ContainerInfo:
     """容器信息"""
     id: str
@@ -31,9 +36,9 @@ class ContainerInfo:
     labels: Optional[Dict[str, str]] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_OPTS)
 class ImageInfo:
-    """镜像信息"""
+    """镜像信息（只读值对象）"""
     id: str
     name: str
     tag: str
@@ -41,7 +46,7 @@ class ImageInfo:
     created_at: float
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class PerformanceMetrics:
     """性能指标"""
     operation: str
@@ -54,6 +59,15 @@ class PerformanceMetrics:
     warmup: bool = False
 
 
+@lru_cache(maxsize=1024)
+def split_image_ref(ref: str) -> Tuple[str, str]:
+    """拆分镜像引用为 (name, tag)；无 tag 时为 latest，兼容带端口的 registry（host:5000/img）"""
+    name, sep, tag = ref.rpartition(":")
+    if not sep or "/" in tag:
+        return ref, "latest"
+    return name, tag
+
+
 class BaseEngine(abc.ABC):
     """容器引擎基础接口"""
 
@@ -129,6 +143,18 @@ class BaseEngine(abc.ABC):
         """获取引擎类型"""
         pass
 
+    def stream_budget(self) -> int:
+        """引擎连接可同时承载的在途请求数（0 表示不限制）"""
+        return 0
+
+    async def ensure_connected(self):
+        """连接被标记失效时重连（默认无需处理）；调用方可在计时开始前调用"""
+        pass
+
+    async def ensure_channels(self, concurrency: int):
+        """按本次运行的并发度准备连接容量（默认无需处理）"""
+        pass
+
     async def health_check(self) -> bool:
         """健康检查"""
         try:
@@ -147,9 +173,9 @@ class BaseEngine(abc.ABC):
                                    end_time: float, success: bool,
                                    error_message: Optional[str] = None,
                                    metadata: Optional[Dict[str, Any]] = None) -> PerformanceMetrics:
-        """创建性能指标对象"""
+        """创建性能指标对象（操作名驻留，同名指标共享同一个字符串对象）"""
         return PerformanceMetrics(
-            operation=operation,
+            operation=sys.intern(operation),
             start_time=start_time,
             end_time=end_time,
             duration=end_time - start_time,
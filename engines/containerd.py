@@ -7,31 +7,41 @@ Note:
 """
 
 import os
+import stat
 from typing import Dict, Any, Optional, List
 
 from .base import BaseEngine, EngineType, ContainerInfo, ImageInfo
 from core.config import EngineConfig
 
 
+def _validate_socket(path: str) -> None:
+    """确认路径是 unix socket；失败抛 FileNotFoundError/OSError（不缓存：daemon 停止后 connect 能发现 socket 消失）"""
+    if not stat.S_ISSOCK(os.stat(path).st_mode):
+        raise OSError(f"{path} is not a unix socket")
+
+
 class ContainerdEngine(BaseEngine):
     """containerd 引擎适配器（主要用于 CRI 场景的端点配置）"""
 
     def __init__(self, config: EngineConfig):
         super().__init__(config)
         self.endpoint = config.endpoint
+        # unix socket 路径只解析一次；非 unix 端点为 None
+        ep = self.endpoint or ""
+        self._sock_path = ep[len("unix://"):] if ep.startswith("unix://") else None
 
     def get_engine_type(self) -> EngineType:
         return EngineType.CONTAINERD
 
     async def connect(self) -> bool:
-        # Best-effort: for unix socket endpoints, just check path exists.
-        ep = self.endpoint or ""
-        if ep.startswith("unix://"):
-            sock = ep.replace("unix://", "", 1)
-            self.connected = os.path.exists(sock)
-            return self.connected
-        self.connected = True
-        return True
+        # Best-effort: for unix socket endpoints, just check the path is a socket (one stat per connect).
+        try:
+            if self._sock_path is not None:
+                _validate_socket(self._sock_path)
+            self.connected = True
+        except OSError:
+            self.connected = False
+        return self.connected
 
     async def disconnect(self):
         self.connected = False
@@ -4,10 +4,9 @@ CRI-O container engine adapter
 
 import asyncio
 import time
-from typing import Dict, Any, Optional, List
-import grpc
+from typing import Dict, Any, Optional, List, Tuple
 
-from .base import BaseEngine, EngineType, ContainerInfo, ImageInfo
+from .base import BaseEngine, EngineType, ContainerInfo, ImageInfo, split_image_ref
 from core.config import EngineConfig
 from core.exceptions import EngineError, ConnectionError
 
@@ -19,6 +18,11 @@ except ImportError:
     api_pb2_grpc = None
 
 
+def _image_name_tag(repo_tags) -> Tuple[str, str]:
+    """取第一个 repo tag 拆分为 (name, tag)；无 tag 的镜像为 unknown:latest"""
+    return split_image_ref(repo_tags[0]) if repo_tags else ("unknown", "latest")
+
+
 class CRIoEngine(BaseEngine):
     """CRI-O容器引擎适配器"""
 
@@ -37,6 +41,8 @@ class CRIoEngine(BaseEngine):
         try:
             if api_pb2_grpc is None:
                 raise EngineError("CRI API not available. Please install cri-api package.")
+            # grpc is only needed once we actually connect.
+            import grpc
 
             # 创建gRPC通道
             if self.endpoint.startswith("unix://"):
@@ -105,11 +111,12 @@ class CRIoEngine(BaseEngine):
                               ports: Optional[Dict[str, Any]] = None) -> ContainerInfo:
         """创建容器"""
         start_time = time.time()
+        container_name = name or f"container-{int(start_time)}"
         try:
             # 创建Pod沙箱
             pod_sandbox_config = api_pb2.PodSandboxConfig(
                 metadata=api_pb2.PodSandboxMetadata(
-                    name=name or f"perf-test-{int(time.time())}",
+                    name=name or f"perf-test-{int(start_time)}",
                     namespace="default",
                 ),
                 hostname="",
@@ -123,7 +130,7 @@ class CRIoEngine(BaseEngine):
             # 创建容器配置
             container_config = api_pb2.ContainerConfig(
                 metadata=api_pb2.ContainerMetadata(
-                    name=name or f"container-{int(time.time())}",
+                    name=container_name,
                 ),
                 image=api_pb2.ImageSpec(image=image),
                 command=command or [],
@@ -147,11 +154,9 @@ class CRIoEngine(BaseEngine):
             container_response = await self.stub.CreateContainer(container_request)
             container_id = container_response.container_id
 
-            end_time = time.time()
-
             return ContainerInfo(
                 id=container_id,
-                name=name or f"container-{int(time.time())}",
+                name=container_name,
                 image=image,
                 status="created",
                 created_at=start_time,
@@ -204,12 +209,11 @@ class CRIoEngine(BaseEngine):
             status_request = api_pb2.ImageStatusRequest(image=image_spec)
             status_response = await self.stub.ImageStatus(status_request)
 
-            end_time = time.time()
-
+            name, tag = split_image_ref(image)
             return ImageInfo(
                 id=status_response.image.id,
-                name=image.split(":")[0],
-                tag=image.split(":")[1] if ":" in image else "latest",
+                name=name,
+                tag=tag,
                 size=status_response.image.size,
                 created_at=start_time
             )
@@ -253,24 +257,18 @@ class CRIoEngine(BaseEngine):
             request = api_pb2.ListImagesRequest()
             response = await self.stub.ListImages(request)
 
-            images = []
-            for image in response.images:
-                # 解析镜像名称和标签
-                repo_tags = image.repo_tags
-                if repo_tags:
-                    name, tag = repo_tags[0].split(":") if ":" in repo_tags[0] else (repo_tags[0], "latest")
-                else:
-                    name, tag = "unknown", "latest"
-
-                images.append(ImageInfo(
+            return [
+                ImageInfo(
                     id=image.id,
                     name=name,
                     tag=tag,
                     size=image.size,
                     created_at=0  # CRI API可能不提供创建时间
-                ))
-
-            return images
+                )
+                for image in response.images
+                # 解析镜像名称和标签（repo_tags 只访问一次）
+                for name, tag in (_image_name_tag(image.repo_tags),)
+            ]
         except Exception as e:
             raise EngineError(f"Failed to list images: {e}")
 
@@ -3,23 +3,194 @@ Docker container engine adapter
 """
 
 import asyncio
+import functools
+import json
+import os
+import shlex
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
-import docker
 
-from .base import BaseEngine, EngineType, ContainerInfo, ImageInfo
+from .base import BaseEngine, EngineType, ContainerInfo, ImageInfo, split_image_ref
 from core.config import EngineConfig
 from core.exceptions import EngineError, ConnectionError
 
+# orjson 可选：stats 等大 JSON 响应用 C 实现解码，否则退回标准库
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+
+def _image_name_tag(repo_tags: Optional[List[str]]):
+    if repo_tags and repo_tags[0] != '<none>:<none>':
+        return split_image_ref(repo_tags[0])
+    return "none", "none"
+
+
+def _exposed_ports(ports) -> Optional[Dict[str, Dict]]:
+    """与 docker SDK 一致地把 ports（[80, "53/udp", (8080, "tcp")] 或 dict）转换为 ExposedPorts"""
+    if not ports:
+        return None
+    exposed = {}
+    for port in ports:
+        if isinstance(port, tuple):
+            key = f"{port[0]}/{port[1]}"
+        else:
+            key = str(port) if "/" in str(port) else f"{port}/tcp"
+        exposed[key] = {}
+    return exposed
+
+
+class _DockerHTTP:
+    """
+    Docker REST API 的原生 asyncio 客户端（unix socket + aiohttp），只承载生命周期/列表等热路径操作。
+
+    与 SDK 路径相比省去线程池切换与 requests/urllib3 开销，这部分开销会直接计入被测时延。
+    """
+
+    _BASE = "http://docker"
+
+    def __init__(self, socket_path: str, timeout: float, api_version: Optional[str] = None):
+        import aiohttp
+
+        self._aiohttp = aiohttp
+        # 与 SDK 协商出的 API 版本保持一致（/v1.43/containers/...）
+        self._base = f"{self._BASE}/v{api_version}" if api_version else self._BASE
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.UnixConnector(path=socket_path),
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        )
+
+    async def request(self, method: str, path: str, params: Optional[Dict[str, str]] = None,
+                      body: Any = None, timeout: Optional[float] = None) -> Any:
+        kwargs: Dict[str, Any] = {}
+        if params:
+            kwargs["params"] = params
+        if body is not None:
+            kwargs["data"] = _json_dumps(body)
+            kwargs["headers"] = {"Content-Type": "application/json"}
+        if timeout is not None:
+            kwargs["timeout"] = self._aiohttp.ClientTimeout(total=timeout)
+        async with self.session.request(method, self._base + path, **kwargs) as resp:
+            payload = await resp.read()
+            if resp.status >= 400:
+                try:
+                    message = _json_loads(payload).get("message", "")
+                except Exception:
+                    message = payload.decode("utf-8", errors="replace")
+                raise EngineError(f"{resp.status} {resp.reason}: {message}")
+            if payload and resp.content_type == "application/json":
+                return _json_loads(payload)
+            return payload
+
+    async def close(self):
+        await self.session.close()
+
+
+class _StatsStream:
+    """
+    单个容器的 stats 推送流：后台守护线程读取 /containers/{id}/stats?stream=true，只保留最新一帧。
+
+    stream=False 每次调用都要等待 daemon 的 ~1s 采样窗口；常驻流把这个等待摊到所有读取上。
+    """
+
+    def __init__(self, client, container_id: str):
+        self.latest: Optional[Dict[str, Any]] = None
+        self.ready = threading.Event()
+        self._resp = client._get(client._url("/containers/{0}/stats", container_id),
+                                 params={"stream": True}, stream=True)
+        client._raise_for_status(self._resp)
+        self._thread = threading.Thread(target=self._pump, name=f"docker-stats-{container_id[:12]}", daemon=True)
+        self._thread.start()
+
+    def _pump(self):
+        try:
+            for line in self._resp.iter_lines():
+                if not line:
+                    continue
+                frame = _json_loads(line)
+                self.latest = frame
+                # 首帧的 precpu_stats 为空，拿到带上一周期数据的帧后才可计算 CPU 使用率
+                if not self.ready.is_set() and (frame.get('precpu_stats') or {}).get('system_cpu_usage') is not None:
+                    self.ready.set()
+        except Exception:
+            pass
+        finally:
+            # 流结束（容器退出/被关闭）：唤醒等待者，由调用方退回一次性查询
+            self.ready.set()
+
+    @property
+    def alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def close(self):
+        try:
+            self._resp.close()
+        except Exception:
+            pass
+
 
 class DockerEngine(BaseEngine):
     """Docker容器引擎适配器"""
 
+    # docker.APIClient 是同步的：所有调用放到引擎自有线程池，避免阻塞事件循环、串行化并发任务
+    IO_WORKERS = 16
+    # is_connected() 复用最近一次成功的 daemon 调用，TTL 内不再重复 ping
+    PING_TTL = 1.0
+    # unix socket 端点默认走原生 aiohttp 客户端；ISULAD_PERF_DOCKER_SDK=1 强制全部走 docker SDK
+    LEGACY_SDK_ENV = "ISULAD_PERF_DOCKER_SDK"
+
     def __init__(self, config: EngineConfig):
         super().__init__(config)
         self.endpoint = config.endpoint
         self.timeout = config.timeout
         self.client = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._http: Optional[_DockerHTTP] = None
+        self._last_ok = 0.0
+        # 容器 CPU 数（percpu_usage 长度）在容器生命周期内不变，按容器缓存
+        self._ncpus: Dict[str, int] = {}
+        self._stats_streams: Dict[str, _StatsStream] = {}
+
+    async def _call(self, fn, *args, **kwargs):
+        """在引擎线程池中执行阻塞的 SDK 调用"""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.IO_WORKERS, thread_name_prefix="docker-io")
+        loop = asyncio.get_running_loop()
+        try:
+            result = await loop.run_in_executor(self._pool, functools.partial(fn, *args, **kwargs))
+        except Exception:
+            self._last_ok = 0.0
+            raise
+        # 任一成功的调用都说明 daemon 可达
+        self._last_ok = time.monotonic()
+        return result
+
+    async def _http_call(self, method: str, path: str, **kwargs) -> Any:
+        """经原生 HTTP 客户端调用 Docker API（与 _call 相同的可达性记录）"""
+        try:
+            result = await self._http.request(method, path, **kwargs)
+        except Exception:
+            self._last_ok = 0.0
+            raise
+        self._last_ok = time.monotonic()
+        return result
+
+    def _native_http_available(self, socket_path: Optional[str]) -> bool:
+        if socket_path is None or os.environ.get(self.LEGACY_SDK_ENV):
+            return False
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            return False
+        return True
 
     def get_engine_type(self) -> EngineType:
         return EngineType.DOCKER
@@ -27,15 +198,30 @@ class DockerEngine(BaseEngine):
     async def connect(self) -> bool:
         """连接到Docker"""
         try:
+            # docker SDK (requests/urllib3) is only needed once we actually connect.
+            import docker
+
+            socket_path = None
             if self.endpoint.startswith("unix://"):
                 socket_path = self.endpoint.replace("unix://", "")
-                self.client = docker.APIClient(base_url=f"unix://{socket_path}")
+                base_url = f"unix://{socket_path}"
             else:
                 # TCP连接
-                self.client = docker.APIClient(base_url=self.endpoint)
+                base_url = self.endpoint
+
+            # 连接池大小与线程池一致：每个 IO 线程都能复用一条 keep-alive 连接，
+            # 不会因连接池满而丢弃连接、在下次调用时重新 connect（计入被测时延）。
+            # 构造时会同步探测 API 版本，同样放到线程池里执行。
+            self.client = await self._call(docker.APIClient, base_url=base_url, max_pool_size=self.IO_WORKERS)
 
             # 测试连接
-            self.client.ping()
+            await self._call(self.client.ping)
+
+            # 热路径操作的原生 asyncio 客户端（SDK 仍用于 pull/stats/remove_image 等）
+            if self._native_http_available(socket_path):
+                self._http = _DockerHTTP(socket_path, self.timeout, getattr(self.client, "api_version", None))
+                await self._http_call("GET", "/_ping")
+
             self.connected = True
             return True
 
@@ -45,18 +231,33 @@ class DockerEngine(BaseEngine):
 
     async def disconnect(self):
         """断开连接"""
+        for stream in self._stats_streams.values():
+            stream.close()
+        self._stats_streams.clear()
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
         if self.client:
             self.client.close()
             self.client = None
+        self._last_ok = 0.0
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
         self.connected = False
 
     async def is_connected(self) -> bool:
         """检查连接状态"""
         if not self.connected or not self.client:
             return False
+        if time.monotonic() - self._last_ok < self.PING_TTL:
+            return True
 
         try:
-            self.client.ping()
+            if self._http is not None:
+                await self._http_call("GET", "/_ping")
+            else:
+                await self._call(self.client.ping)
             return True
         except Exception:
             self.connected = False
@@ -68,15 +269,25 @@ class DockerEngine(BaseEngine):
         """创建容器"""
         start_time = time.time()
         try:
-            container = self.client.create_container(
-                image=image,
-                name=name,
-                command=command,
-                ports=ports,
-                detach=True
-            )
-
-            end_time = time.time()
+            if self._http is not None:
+                body = {"Image": image}
+                if command:
+                    body["Cmd"] = shlex.split(command) if isinstance(command, str) else list(command)
+                exposed = _exposed_ports(ports)
+                if exposed:
+                    body["ExposedPorts"] = exposed
+                container = await self._http_call(
+                    "POST", "/containers/create", params={"name": name} if name else None, body=body
+                )
+            else:
+                container = await self._call(
+                    self.client.create_container,
+                    image=image,
+                    name=name,
+                    command=command,
+                    ports=ports,
+                    detach=True
+                )
 
             return ContainerInfo(
                 id=container['Id'],
@@ -92,30 +303,39 @@ class DockerEngine(BaseEngine):
 
     async def start_container(self, container_id: str) -> bool:
         """启动容器"""
-        start_time = time.time()
         try:
-            self.client.start(container_id)
-            end_time = time.time()
+            if self._http is not None:
+                await self._http_call("POST", f"/containers/{container_id}/start")
+            else:
+                await self._call(self.client.start, container_id)
             return True
         except Exception as e:
             raise EngineError(f"Failed to start container {container_id}: {e}")
 
     async def stop_container(self, container_id: str, timeout: int = 30) -> bool:
         """停止容器"""
-        start_time = time.time()
         try:
-            self.client.stop(container_id, timeout=timeout)
-            end_time = time.time()
+            if self._http is not None:
+                await self._http_call("POST", f"/containers/{container_id}/stop", params={"t": str(timeout)},
+                                      timeout=self.timeout + timeout)
+            else:
+                await self._call(self.client.stop, container_id, timeout=timeout)
             return True
         except Exception as e:
             raise EngineError(f"Failed to stop container {container_id}: {e}")
 
     async def remove_container(self, container_id: str, force: bool = False) -> bool:
         """删除容器"""
-        start_time = time.time()
         try:
-            self.client.remove_container(container_id, force=force)
-            end_time = time.time()
+            if self._http is not None:
+                await self._http_call("DELETE", f"/containers/{container_id}",
+                                      params={"v": "0", "link": "0", "force": "1" if force else "0"})
+            else:
+                await self._call(self.client.remove_container, container_id, force=force)
+            self._ncpus.pop(container_id, None)
+            stream = self._stats_streams.pop(container_id, None)
+            if stream is not None:
+                stream.close()
             return True
         except Exception as e:
             raise EngineError(f"Failed to remove container {container_id}: {e}")
@@ -124,17 +344,13 @@ class DockerEngine(BaseEngine):
         """拉取镜像"""
         start_time = time.time()
         try:
-            # Docker Python库的pull是同步的，需要在executor中运行
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(None, self.client.pull, image)
+            result = await self._call(self.client.pull, image)
 
             # 获取镜像信息
-            images = self.client.images(name=image)
+            images = await self._call(self.client.images, name=image)
             if images:
                 image_info = images[0]
-                name, tag = image.split(":") if ":" in image else (image, "latest")
-
-                end_time = time.time()
+                name, tag = split_image_ref(image)
 
                 return ImageInfo(
                     id=image_info['Id'],
@@ -152,7 +368,7 @@ class DockerEngine(BaseEngine):
     async def remove_image(self, image_id: str) -> bool:
         """删除镜像"""
         try:
-            self.client.remove_image(image_id)
+            await self._call(self.client.remove_image, image_id)
             return True
         except Exception as e:
             raise EngineError(f"Failed to remove image {image_id}: {e}")
@@ -160,53 +376,76 @@ class DockerEngine(BaseEngine):
     async def list_containers(self, all: bool = False) -> List[ContainerInfo]:
         """列出容器"""
         try:
-            containers = self.client.containers(all=all)
+            if self._http is not None:
+                containers = await self._http_call("GET", "/containers/json", params={"all": "1" if all else "0"})
+            else:
+                containers = await self._call(self.client.containers, all=all)
 
-            result = []
-            for container in containers:
-                result.append(ContainerInfo(
+            return [
+                ContainerInfo(
                     id=container['Id'],
                     name=container['Names'][0] if container['Names'] else container['Id'][:12],
                     image=container['Image'],
                     status=container['State'],
                     created_at=container['Created'],
                     ports=container.get('Ports', [])
-                ))
-
-            return result
+                )
+                for container in containers
+            ]
         except Exception as e:
             raise EngineError(f"Failed to list containers: {e}")
 
     async def list_images(self) -> List[ImageInfo]:
         """列出镜像"""
         try:
-            images = self.client.images()
-
-            result = []
-            for image in images:
-                # 解析镜像名称和标签
-                repo_tags = image.get('RepoTags', [])
-                if repo_tags and repo_tags[0] != '<none>:<none>':
-                    name, tag = repo_tags[0].split(":") if ":" in repo_tags[0] else (repo_tags[0], "latest")
-                else:
-                    name, tag = "none", "none"
+            if self._http is not None:
+                images = await self._http_call("GET", "/images/json")
+            else:
+                images = await self._call(self.client.images)
 
-                result.append(ImageInfo(
+            # 解析镜像名称和标签（按首个 RepoTag，结果按引用缓存）
+            return [
+                ImageInfo(
                     id=image['Id'],
                     name=name,
                     tag=tag,
                     size=image.get('Size', 0),
                     created_at=image.get('Created', 0)
-                ))
-
-            return result
+                )
+                for image in images
+                for name, tag in (_image_name_tag(image.get('RepoTags')),)
+            ]
         except Exception as e:
             raise EngineError(f"Failed to list images: {e}")
 
+    def _fetch_stats(self, container_id: str) -> Dict[str, Any]:
+        """一次性获取 stats：直接读取原始响应体并解码（等价于 client.stats(stream=False)）"""
+        resp = self.client._get(self.client._url("/containers/{0}/stats", container_id), params={"stream": False})
+        self.client._raise_for_status(resp)
+        return _json_loads(resp.content)
+
+    def _latest_stats(self, container_id: str) -> Dict[str, Any]:
+        """返回容器 stats 流的最新一帧（首次调用时建立流并等待第一帧可用数据）"""
+        stream = self._stats_streams.get(container_id)
+        if stream is None or not stream.alive:
+            if stream is not None:
+                stream.close()
+            stream = self._stats_streams[container_id] = _StatsStream(self.client, container_id)
+        stream.ready.wait(self.timeout)
+        if stream.latest is None:
+            # 流没有产出数据（容器已停止等）：退回一次性查询
+            return self._fetch_stats(container_id)
+        return stream.latest
+
     async def get_container_stats(self, container_id: str) -> Dict[str, Any]:
         """获取容器统计信息"""
         try:
-            stats = self.client.stats(container_id, stream=False)
+            stream = self._stats_streams.get(container_id)
+            if stream is not None and stream.alive and stream.ready.is_set() and stream.latest is not None:
+                # 热路径：直接读取后台流缓存的最新一帧，无需往返 daemon
+                stats = stream.latest
+            else:
+                stats = await self._call(self._latest_stats, container_id)
 
             # 解析统计信息
             cpu_stats = stats['cpu_stats']
@@ -219,11 +458,16 @@ class DockerEngine(BaseEngine):
             system_delta = cpu_stats['system_cpu_usage'] - precpu_stats['system_cpu_usage']
             cpu_percent = 0.0
             if system_delta > 0:
-                cpu_percent = (cpu_delta / system_delta) * len(cpu_stats['cpu_usage']['percpu_usage']) * 100.0
-
-            # 网络统计
-            rx_bytes = sum(net.get('rx_bytes', 0) for net in networks.values())
-            tx_bytes = sum(net.get('tx_bytes', 0) for net in networks.values())
+                ncpus = self._ncpus.get(container_id)
+                if ncpus is None:
+                    ncpus = self._ncpus[container_id] = len(cpu_stats['cpu_usage']['percpu_usage'])
+                cpu_percent = (cpu_delta / system_delta) * ncpus * 100.0
+
+            # 网络统计（单次遍历累加 rx/tx）
+            rx_bytes = tx_bytes = 0
+            for net in networks.values():
+                rx_bytes += net.get('rx_bytes', 0)
+                tx_bytes += net.get('tx_bytes', 0)
 
             return {
                 "cpu": {
@@ -3,22 +3,56 @@ iSulad container engine adapter
 """
 
 import asyncio
+import itertools
 import time
-from typing import Dict, Any, Optional, List
-import grpc
+from typing import Dict, Any, Optional, List, Tuple
 import json
 
-from .base import BaseEngine, EngineType, ContainerInfo, ImageInfo, PerformanceMetrics
+from .base import BaseEngine, EngineType, ContainerInfo, ImageInfo, PerformanceMetrics, split_image_ref
 from core.config import EngineConfig
 from core.exceptions import EngineError, ConnectionError
 
 # 导入CRI相关模块（需要安装cri-api）
 try:
     from cri_api import api_pb2, api_pb2_grpc
+    # 生命周期热路径用到的消息类型绑定为模块级名字，省去每次调用的 api_pb2 属性查找
+    from cri_api.api_pb2 import (
+        PodSandboxConfig as _PodSandboxConfig,
+        RunPodSandboxRequest as _RunPodSandboxRequest,
+        ContainerConfig as _ContainerConfig,
+        CreateContainerRequest as _CreateContainerRequest,
+        StartContainerRequest as _StartContainerRequest,
+        StopContainerRequest as _StopContainerRequest,
+        RemoveContainerRequest as _RemoveContainerRequest,
+    )
 except ImportError:
     # 如果没有安装CRI API，使用模拟实现
     api_pb2 = None
     api_pb2_grpc = None
+    _PodSandboxConfig = _RunPodSandboxRequest = _ContainerConfig = _CreateContainerRequest = None
+    _StartContainerRequest = _StopContainerRequest = _RemoveContainerRequest = None
+
+# gRPC channel 参数：消息上限 + HTTP/2 写缓冲/帧大小 + keepalive，偏向吞吐
+_CHANNEL_OPTIONS = (
+    # ListContainers/ListImages 为单个 unary 响应，大规模节点上需要更大的接收上限
+    ('grpc.max_receive_message_length', 256 * 1024 * 1024),
+    ('grpc.max_send_message_length', 50 * 1024 * 1024),
+    ('grpc.http2.write_buffer_size', 1 << 20),
+    # HTTP/2 允许的最大帧（2^24-1）
+    ('grpc.http2.max_frame_size', (1 << 24) - 1),
+    ('grpc.keepalive_time_ms', 20000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.optimization_target', 'throughput'),
+)
+
+# 生命周期热路径 RPC：connect 时按 channel 预先构建 unary_unary 可调用对象，绕过生成 stub 的逐次分派
+_HOT_RPCS = ("StartContainer", "StopContainer", "RemoveContainer")
+
+
+def _image_name_tag(repo_tags) -> Tuple[str, str]:
+    """取第一个 repo tag 拆分为 (name, tag)；无 tag 的镜像为 unknown:latest"""
+    return split_image_ref(repo_tags[0]) if repo_tags else ("unknown", "latest")
 
 
 class ISuladEngine(BaseEngine):
@@ -28,14 +62,84 @@ class ISuladEngine(BaseEngine):
         super().__init__(config)
         self.endpoint = config.endpoint
         self.timeout = config.timeout
-        self.channel = None
-        self.stub = None
+        self.pool_size = max(int(getattr(config, "channels", 1) or 1), 1)
+        self._channels: list = []
+        self._stubs: list = []
+        self._rr = None
+        self._hot: Dict[str, Any] = {}
+        self._target = ""
+        # 重连后替换下来的旧 channel：其他任务可能仍有在途 RPC，disconnect 时才关闭
+        self._retired: list = []
+        self._reconnect_lock: Optional[asyncio.Lock] = None
+        # 静态字段只构建一次，create_container 中 CopyFrom 后仅改写 name/image/command
+        if api_pb2 is not None:
+            self._sandbox_template = api_pb2.PodSandboxConfig(
+                metadata=api_pb2.PodSandboxMetadata(namespace="default"),
+                hostname="",
+                log_directory="/tmp",
+            )
+            self._container_template = api_pb2.ContainerConfig(working_dir="/", log_path="")
+
+    @property
+    def stub(self):
+        """轮询返回 channel 池中的下一个 stub（未连接时为 None）"""
+        return next(self._rr) if self._rr is not None else None
+
+    # 每条 channel 预留的并发 stream 数（低于 HTTP/2 常见的 100 上限，留出余量）
+    STREAMS_PER_CHANNEL = 80
+
+    def stream_budget(self) -> int:
+        """已连接时按 channel 池大小给出并发预算；未连接（调用不经过 gRPC）时不限制"""
+        return len(self._channels) * self.STREAMS_PER_CHANNEL if self.connected else 0
 
     def get_engine_type(self) -> EngineType:
         return EngineType.ISULAD
 
+    async def ensure_channels(self, concurrency: int):
+        """
+        按本次运行的并发度扩充 channel 池（每 50 个并发一条，且保证 stream 预算不低于并发度）。
+
+        池只增不减；未连接时只记录目标大小，在 connect 时生效。
+        """
+        concurrency = max(int(concurrency or 1), 1)
+        want = max(concurrency // 50, -(-concurrency // self.STREAMS_PER_CHANNEL), self.pool_size)
+        self.pool_size = want
+        if not self.connected or len(self._channels) >= want:
+            return
+        self._install_pool(self._channels + [self._open_channel(i) for i in range(len(self._channels), want)])
+
+    def _open_channel(self, channel_id: int):
+        """按 connect 时解析的 target 新建一条 channel"""
+        import grpc
+
+        # 本地 subchannel 池 + 互不相同的 channel 参数，避免多个 channel 复用同一条连接
+        return grpc.aio.insecure_channel(
+            self._target,
+            options=[
+                *_CHANNEL_OPTIONS,
+                ('grpc.use_local_subchannel_pool', 1),
+                ('isulad_perf.channel_id', channel_id),
+            ]
+        )
+
+    def _install_pool(self, channels: list):
+        """把 channel 列表设为当前池，并重建 stub 轮询与热路径可调用对象"""
+        stubs = [api_pb2_grpc.RuntimeServiceStub(channel) for channel in channels]
+        self._channels, self._stubs = channels, stubs
+        self._rr = itertools.cycle(stubs)
+        self._hot = self._build_hot_calls(channels)
+
+    @staticmethod
+    async def _close_channels(channels: list):
+        for channel in channels:
+            try:
+                await channel.close()
+            except Exception:
+                pass
+
     async def connect(self) -> bool:
         """连接到iSulad"""
+        channels = []
         try:
             if api_pb2_grpc is None:
                 raise EngineError("CRI API not available. Please install cri-api package.")
@@ -43,104 +147,114 @@ class ISuladEngine(BaseEngine):
             # 创建gRPC通道
             if self.endpoint.startswith("unix://"):
                 socket_path = self.endpoint.replace("unix://", "")
-                self.channel = grpc.aio.insecure_channel(
-                    f"unix:{socket_path}",
-                    options=[
-                        ('grpc.max_receive_message_length', 50 * 1024 * 1024),
-                        ('grpc.max_send_message_length', 50 * 1024 * 1024),
-                    ]
-                )
+                self._target = f"unix:{socket_path}"
             else:
                 # TCP连接
                 host, port = self.endpoint.split(":")
-                self.channel = grpc.aio.insecure_channel(
-                    f"{host}:{port}",
-                    options=[
-                        ('grpc.max_receive_message_length', 50 * 1024 * 1024),
-                        ('grpc.max_send_message_length', 50 * 1024 * 1024),
-                    ]
-                )
+                self._target = f"{host}:{port}"
 
-            # 创建stub
-            self.stub = api_pb2_grpc.RuntimeServiceStub(self.channel)
+            channels = [self._open_channel(i) for i in range(self.pool_size)]
 
-            # 测试连接
+            # 测试连接（探测成功后才启用新池）
             version_request = api_pb2.VersionRequest()
-            response = await asyncio.wait_for(
-                self.stub.Version(version_request),
+            await asyncio.wait_for(
+                api_pb2_grpc.RuntimeServiceStub(channels[0]).Version(version_request),
                 timeout=self.timeout
             )
 
+            self._install_pool(channels)
             self.connected = True
             return True
 
         except Exception as e:
             self.connected = False
+            await self._close_channels(channels)
             raise ConnectionError(f"Failed to connect to iSulad: {e}")
 
+    @staticmethod
+    def _build_hot_calls(channels: list) -> Dict[str, Any]:
+        """RPC 名 -> 在各 channel 间轮询的 unary_unary 可调用对象"""
+        service = api_pb2.DESCRIPTOR.services_by_name["RuntimeService"].full_name
+        hot = {}
+        for rpc in _HOT_RPCS:
+            request_cls = getattr(api_pb2, f"{rpc}Request")
+            response_cls = getattr(api_pb2, f"{rpc}Response")
+            hot[rpc] = itertools.cycle([
+                channel.unary_unary(
+                    f"/{service}/{rpc}",
+                    request_serializer=request_cls.SerializeToString,
+                    response_deserializer=response_cls.FromString,
+                )
+                for channel in channels
+            ])
+        return hot
+
     async def disconnect(self):
         """断开连接"""
-        if self.channel:
-            await self.channel.close()
-            self.channel = None
-            self.stub = None
+        channels, self._channels, self._stubs, self._rr = self._channels, [], [], None
+        channels, self._retired = channels + self._retired, []
+        self._hot = {}
         self.connected = False
+        await self._close_channels(channels)
 
     async def is_connected(self) -> bool:
-        """检查连接状态"""
-        if not self.connected or not self.stub:
-            return False
-
-        try:
-            version_request = api_pb2.VersionRequest()
-            await asyncio.wait_for(
-                self.stub.Version(version_request),
-                timeout=5
-            )
-            return True
-        except Exception:
+        """检查连接状态（不额外发 Version RPC；连接失效由 RPC 的 UNAVAILABLE 错误反映）"""
+        return self.connected and self._rr is not None
+
+    async def ensure_connected(self):
+        """
+        连接被标记失效后重连（由下一次调用在发起 RPC 前触发，不计入出错那次操作的耗时）。
+
+        并发任务中只有一个执行重连；新池探测成功后才替换旧池，失败时旧池保持不变。
+        """
+        if self.connected or not self._channels:
+            return
+        if self._reconnect_lock is None:
+            self._reconnect_lock = asyncio.Lock()
+        async with self._reconnect_lock:
+            if self.connected:
+                return
+            old = self._channels
+            await self.connect()
+            self._retired.extend(old)
+
+    async def _handle_rpc_error(self, error: Exception):
+        """RPC 返回 UNAVAILABLE 时只把连接标记为失效；不在错误路径上重连，也不关闭其他任务正在使用的 channel"""
+        code = getattr(error, "code", None)
+        if not callable(code):
+            return
+        import grpc
+
+        if code() == grpc.StatusCode.UNAVAILABLE:
             self.connected = False
-            return False
 
     async def create_container(self, image: str, name: Optional[str] = None,
                               command: Optional[List[str]] = None,
                               ports: Optional[Dict[str, Any]] = None) -> ContainerInfo:
         """创建容器"""
+        await self.ensure_connected()
         start_time = time.time()
+        container_name = name or f"container-{int(start_time)}"
         try:
             # 创建Pod沙箱
-            pod_sandbox_config = api_pb2.PodSandboxConfig(
-                metadata=api_pb2.PodSandboxMetadata(
-                    name=name or f"perf-test-{int(time.time())}",
-                    namespace="default",
-                ),
-                hostname="",
-                log_directory="/tmp",
-            )
+            pod_sandbox_config = _PodSandboxConfig()
+            pod_sandbox_config.CopyFrom(self._sandbox_template)
+            pod_sandbox_config.metadata.name = name or f"perf-test-{int(start_time)}"
 
-            sandbox_request = api_pb2.RunPodSandboxRequest(config=pod_sandbox_config)
+            sandbox_request = _RunPodSandboxRequest(config=pod_sandbox_config)
             sandbox_response = await self.stub.RunPodSandbox(sandbox_request)
             pod_sandbox_id = sandbox_response.pod_sandbox_id
 
             # 创建容器配置
-            container_config = api_pb2.ContainerConfig(
-                metadata=api_pb2.ContainerMetadata(
-                    name=name or f"container-{int(time.time())}",
-                ),
-                image=api_pb2.ImageSpec(image=image),
-                command=command or [],
-                args=[],
-                working_dir="/",
-                labels={},
-                annotations={},
-                mounts=[],
-                devices=[],
-                env=[],
-                log_path="",
-            )
+            container_config = _ContainerConfig()
+            container_config.CopyFrom(self._container_template)
+            container_config.metadata.name = container_name
+            container_config.image.image = image
+            if command:
+                container_config.command.extend(command)
 
             # 创建容器
-            container_request = api_pb2.CreateContainerRequest(
+            container_request = _CreateContainerRequest(
                 pod_sandbox_id=pod_sandbox_id,
                 config=container_config,
                 sandbox_config=pod_sandbox_config,
@@ -149,11 +263,9 @@ class ISuladEngine(BaseEngine):
             container_response = await self.stub.CreateContainer(container_request)
             container_id = container_response.container_id
 
-            end_time = time.time()
-
             return ContainerInfo(
                 id=container_id,
-                name=name or f"container-{int(time.time())}",
+                name=container_name,
                 image=image,
                 status="created",
                 created_at=start_time,
@@ -162,47 +274,48 @@ class ISuladEngine(BaseEngine):
             )
 
         except Exception as e:
-            end_time = time.time()
+            await self._handle_rpc_error(e)
             raise EngineError(f"Failed to create container: {e}")
 
     async def start_container(self, container_id: str) -> bool:
         """启动容器"""
-        start_time = time.time()
+        await self.ensure_connected()
         try:
-            request = api_pb2.StartContainerRequest(container_id=container_id)
-            await self.stub.StartContainer(request)
-            end_time = time.time()
+            request = _StartContainerRequest(container_id=container_id)
+            await next(self._hot["StartContainer"])(request)
             return True
         except Exception as e:
+            await self._handle_rpc_error(e)
             raise EngineError(f"Failed to start container {container_id}: {e}")
 
     async def stop_container(self, container_id: str, timeout: int = 30) -> bool:
         """停止容器"""
-        start_time = time.time()
+        await self.ensure_connected()
         try:
-            request = api_pb2.StopContainerRequest(
+            request = _StopContainerRequest(
                 container_id=container_id,
                 timeout=timeout
             )
-            await self.stub.StopContainer(request)
-            end_time = time.time()
+            await next(self._hot["StopContainer"])(request)
             return True
         except Exception as e:
+            await self._handle_rpc_error(e)
             raise EngineError(f"Failed to stop container {container_id}: {e}")
 
     async def remove_container(self, container_id: str, force: bool = False) -> bool:
         """删除容器"""
-        start_time = time.time()
+        await self.ensure_connected()
         try:
-            request = api_pb2.RemoveContainerRequest(container_id=container_id)
-            await self.stub.RemoveContainer(request)
-            end_time = time.time()
+            request = _RemoveContainerRequest(container_id=container_id)
+            await next(self._hot["RemoveContainer"])(request)
             return True
         except Exception as e:
+            await self._handle_rpc_error(e)
             raise EngineError(f"Failed to remove container {container_id}: {e}")
 
     async def pull_image(self, image: str) -> ImageInfo:
         """拉取镜像"""
+        await self.ensure_connected()
         start_time = time.time()
         try:
             image_spec = api_pb2.ImageSpec(image=image)
@@ -213,78 +326,78 @@ class ISuladEngine(BaseEngine):
             status_request = api_pb2.ImageStatusRequest(image=image_spec)
             status_response = await self.stub.ImageStatus(status_request)
 
-            end_time = time.time()
-
+            name, tag = split_image_ref(image)
             return ImageInfo(
                 id=status_response.image.id,
-                name=image.split(":")[0],
-                tag=image.split(":")[1] if ":" in image else "latest",
+                name=name,
+                tag=tag,
                 size=status_response.image.size,
                 created_at=start_time
             )
         except Exception as e:
+            await self._handle_rpc_error(e)
             raise EngineError(f"Failed to pull image {image}: {e}")
 
     async def remove_image(self, image_id: str) -> bool:
         """删除镜像"""
+        await self.ensure_connected()
         try:
             image_spec = api_pb2.ImageSpec(image=image_id)
             request = api_pb2.RemoveImageRequest(image=image_spec)
             await self.stub.RemoveImage(request)
             return True
         except Exception as e:
+            await self._handle_rpc_error(e)
             raise EngineError(f"Failed to remove image {image_id}: {e}")
 
     async def list_containers(self, all: bool = False) -> List[ContainerInfo]:
         """列出容器"""
+        await self.ensure_connected()
         try:
             request = api_pb2.ListContainersRequest()
             response = await self.stub.ListContainers(request)
 
-            containers = []
-            for container in response.containers:
-                containers.append(ContainerInfo(
+            return [
+                ContainerInfo(
                     id=container.id,
                     name=container.metadata.name,
                     image=container.image.image,
                     status=container.state,
                     created_at=container.created_at,
                     labels=dict(container.labels)
-                ))
-
-            return containers
+                )
+                for container in response.containers
+            ]
         except Exception as e:
+            await self._handle_rpc_error(e)
             raise EngineError(f"Failed to list containers: {e}")
 
     async def list_images(self) -> List[ImageInfo]:
         """列出镜像"""
+        await self.ensure_connected()
         try:
             request = api_pb2.ListImagesRequest()
             response = await self.stub.ListImages(request)
 
-            images = []
-            for image in response.images:
-                # 解析镜像名称和标签
-                repo_tags = image.repo_tags
-                if repo_tags:
-                    name, tag = repo_tags[0].split(":") if ":" in repo_tags[0] else (repo_tags[0], "latest")
-                else:
-                    name, tag = "unknown", "latest"
-
-                images.append(ImageInfo(
+            return [
+                ImageInfo(
                     id=image.id,
                     name=name,
                     tag=tag,
                     size=image.size,
                     created_at=0  # CRI API可能不提供创建时间
-                ))
-
-            return images
+                )
+                for image in response.images
+                # 解析镜像名称和标签（repo_tags 只访问一次）
+                for name, tag in (_image_name_tag(image.repo_tags),)
+            ]
         except Exception as e:
+            await self._handle_rpc_error(e)
             raise EngineError(f"Failed to list images: {e}")
 
     async def get_container_stats(self, container_id: str) -> Dict[str, Any]:
         """获取容器统计信息"""
+        await self.ensure_connected()
         try:
             request = api_pb2.ContainerStatsRequest(container_id=container_id)
             response = await self.stub.ContainerStats(request)
@@ -313,4 +426,5 @@ class ISuladEngine(BaseEngine):
                 ]
             }
         except Exception as e:
+            await self._handle_rpc_error(e)
             raise EngineError(f"Failed to get container stats for {container_id}: {e}")
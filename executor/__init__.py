@@ -2,8 +2,45 @@
 Test executors for iSulad Performance Testing Framework
 """
 
+import importlib
+from typing import Dict, Tuple, Type
+
+from core.config import TestConfig
+from core.exceptions import ExecutorError
+from engines.base import BaseEngine
 from .base import BaseExecutor, ExecutorType
-from .cri_executor import CRIExecutor
-from .client_executor import ClientExecutor
 
-__all__ = ['BaseExecutor', 'ExecutorType', 'CRIExecutor', 'ClientExecutor']
+# 执行器注册表：接口类型 -> (模块, 类名)，执行器模块在首次使用时才导入
+_EXECUTOR_REGISTRY: Dict[str, Tuple[str, str]] = {
+    ExecutorType.CRI.value: (".cri_executor", "CRIExecutor"),
+    ExecutorType.CLIENT.value: (".client_executor", "ClientExecutor"),
+}
+_EXECUTOR_CLASSES = {cls_name: (mod, cls_name) for mod, cls_name in _EXECUTOR_REGISTRY.values()}
+
+
+def _load_executor_class(module: str, cls_name: str) -> Type[BaseExecutor]:
+    return getattr(importlib.import_module(module, __name__), cls_name)
+
+
+def __getattr__(name: str):
+    # Keep `from executor import CRIExecutor` working without importing every executor up front.
+    if name in _EXECUTOR_CLASSES:
+        return _load_executor_class(*_EXECUTOR_CLASSES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def list_executors() -> Dict[str, str]:
+    """列出已注册的执行器（接口类型 -> 执行器类名）"""
+    return {name: cls_name for name, (_, cls_name) in _EXECUTOR_REGISTRY.items()}
+
+
+def create_executor(executor_type: str, engine: BaseEngine, config: TestConfig) -> BaseExecutor:
+    """按接口类型创建执行器实例"""
+    try:
+        module, cls_name = _EXECUTOR_REGISTRY[str(executor_type).lower()]
+    except KeyError:
+        raise ExecutorError(f"Unsupported executor type: {executor_type}")
+    return _load_executor_class(module, cls_name)(engine, config)
+
+
+__all__ = ['BaseExecutor', 'ExecutorType', 'CRIExecutor', 'ClientExecutor', 'list_executors', 'create_executor']
@@ -4,15 +4,59 @@ Base executor interface for performance tests
 
 import abc
 import asyncio
+import os
+import shutil
 import time
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Union
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
+
+import numpy as np
 
 from core.config import TestConfig
 from core.exceptions import ExecutorError
+from core.logger import get_logger
 from engines.base import BaseEngine, PerformanceMetrics
 
+logger = get_logger(__name__)
+
+
+@lru_cache(maxsize=64)
+def resolve_executable(name: str) -> str:
+    """
+    把命令名解析为绝对路径（结果缓存），子进程启动时不再逐个 PATH 目录尝试 exec。
+
+    找不到时原样返回，由 exec 抛 FileNotFoundError。
+    """
+    if os.sep in name:
+        return name
+    return shutil.which(name) or name
+
+
+def count_table_rows(output: Union[str, bytes]) -> int:
+    """统计 CLI 表格输出的数据行数（不含表头），直接数换行；传入原始 bytes 时无需先解码"""
+    stripped = output.strip()
+    if not stripped:
+        return 0
+    return stripped.count(b"\n" if isinstance(stripped, bytes) else "\n")
+
+
+class MetricSpan:
+    """
+    单次操作的计时：start 为墙钟时间（作为指标的 start_time），耗时按单调的 perf_counter 计算，
+    end() 返回换算到同一墙钟基准的 end_time，不受 NTP 校时影响。
+    """
+
+    __slots__ = ("start", "_t0")
+
+    def __init__(self):
+        self.start = time.time()
+        self._t0 = time.perf_counter()
+
+    def end(self) -> float:
+        return self.start + (time.perf_counter() - self._t0)
+
 
 class ExecutorType(Enum):
     """执行器类型枚举"""
@@ -49,15 +93,28 @@ class TestContext:
 class BaseExecutor(abc.ABC):
     """性能测试执行器基础接口"""
 
+    # 进度回调节流：每完成约 1/PROGRESS_STEPS 或距上次超过 PROGRESS_INTERVAL 秒才回调一次，最后一次必回调
+    PROGRESS_STEPS = 200
+    PROGRESS_INTERVAL = 0.05
+
     def __init__(self, engine: BaseEngine, config: TestConfig):
         self.engine = engine
         self.config = config
         self._progress_callback: Optional[Callable[[str, int, int], None]] = None
+        self._progress_last = 0.0
 
     def set_progress_callback(self, callback: Callable[[str, int, int], None]):
         """设置进度回调函数"""
         self._progress_callback = callback
 
+    def _report_progress(self, phase: str, done: int, total: int, step: int):
+        """按步长/时间间隔节流后调用进度回调"""
+        now = time.monotonic()
+        if done != total and done % step and now - self._progress_last < self.PROGRESS_INTERVAL:
+            return
+        self._progress_last = now
+        self._progress_callback(phase, done, total)
+
     @abc.abstractmethod
     async def setup(self):
         """测试前准备"""
@@ -95,6 +152,7 @@ class BaseExecutor(abc.ABC):
 
             # 预热阶段
             if self.config.warmup_iterations > 0:
+                step = max(1, self.config.warmup_iterations // self.PROGRESS_STEPS)
                 for i in range(self.config.warmup_iterations):
                     context = TestContext(
                         test_name=test_name,
@@ -109,9 +167,10 @@ class BaseExecutor(abc.ABC):
                     metrics.extend(warmup_metrics)
 
                     if self._progress_callback:
-                        self._progress_callback(f"Warmup {test_name}", i + 1, self.config.warmup_iterations)
+                        self._report_progress(f"Warmup {test_name}", i + 1, self.config.warmup_iterations, step)
 
             # 正式测试阶段
+            step = max(1, self.config.iterations // self.PROGRESS_STEPS)
             for i in range(self.config.iterations):
                 context = TestContext(
                     test_name=test_name,
@@ -124,7 +183,7 @@ class BaseExecutor(abc.ABC):
                 metrics.extend(test_metrics)
 
                 if self._progress_callback:
-                    self._progress_callback(f"Testing {test_name}", i + 1, self.config.iterations)
+                    self._report_progress(f"Testing {test_name}", i + 1, self.config.iterations, step)
 
             # 清理阶段
             await self.teardown()
@@ -174,58 +233,61 @@ class BaseExecutor(abc.ABC):
             )
 
     def _generate_summary(self, metrics: List[PerformanceMetrics]) -> Dict[str, Any]:
-        """生成测试摘要"""
+        """生成测试摘要（按列打包后向量化统计；百分位为最近秩定义 data[min(int(n*p/100), n-1)]）"""
         if not metrics:
             return {}
 
-        # 过滤出正式测试的指标（非预热）
-        test_metrics = [m for m in metrics if not getattr(m, 'warmup', False)]
+        # 列式打包：一次遍历取出各列，过滤出正式测试的指标（非预热）
+        n_all = len(metrics)
+        formal = ~np.fromiter((bool(getattr(m, 'warmup', False)) for m in metrics), dtype=bool, count=n_all)
+        durations = np.fromiter((m.duration for m in metrics), dtype=np.float64, count=n_all)[formal]
+        success = np.fromiter((bool(m.success) for m in metrics), dtype=bool, count=n_all)[formal]
 
-        if not test_metrics:
+        n = int(durations.size)
+        if n == 0:
             return {}
 
-        durations = [m.duration for m in test_metrics]
-        successful = [m for m in test_metrics if m.success]
-        failed = [m for m in test_metrics if not m.success]
+        n_ok = int(np.count_nonzero(success))
+        total = float(durations.sum())
+        # 只需 min/max 与三个百分位所在的秩：一次 partition 代替整体排序
+        ranks = {p: min(int(n * p / 100), n - 1) for p in (50, 95, 99)}
+        data = np.partition(durations, sorted({0, n - 1, *ranks.values()}))
+
+        def pct(p: float) -> float:
+            return float(data[ranks[p]])
 
         return {
-            "total_iterations": len(test_metrics),
-            "successful_iterations": len(successful),
-            "failed_iterations": len(failed),
-            "success_rate": len(successful) / len(test_metrics) if test_metrics else 0,
-            "avg_duration": sum(durations) / len(durations),
-            "min_duration": min(durations),
-            "max_duration": max(durations),
-            "p50_duration": self._percentile(durations, 50),
-            "p95_duration": self._percentile(durations, 95),
-            "p99_duration": self._percentile(durations, 99),
-            "total_time": sum(durations),
-            "operations_per_second": len(test_metrics) / sum(durations) if durations else 0
+            "total_iterations": n,
+            "successful_iterations": n_ok,
+            "failed_iterations": n - n_ok,
+            "success_rate": n_ok / n,
+            "avg_duration": total / n,
+            "min_duration": float(data[0]),
+            "max_duration": float(data[-1]),
+            "p50_duration": pct(50),
+            "p95_duration": pct(95),
+            "p99_duration": pct(99),
+            "total_time": total,
+            "operations_per_second": n / total
         }
 
-    def _percentile(self, data: List[float], percentile: float) -> float:
-        """计算百分位数"""
-        if not data:
-            return 0.0
-
-        data_sorted = sorted(data)
-        index = int(len(data_sorted) * percentile / 100)
-        if index >= len(data_sorted):
-            index = len(data_sorted) - 1
-        return data_sorted[index]
-
     async def run_concurrent_test(self, test_name: str, concurrency: int) -> TestResult:
         """运行并发测试"""
         start_time = time.time()
 
         try:
             await self.setup()
-
-            # 创建并发任务
-            tasks = []
-            for i in range(concurrency):
-                task = asyncio.create_task(self._run_concurrent_iteration(test_name, i))
-                tasks.append(task)
+            # gRPC 引擎按本次并发度扩充 channel 池
+            await self.engine.ensure_channels(concurrency)
+
+            # 始终按请求的并发度创建任务（不在此处限流，否则结果名中的并发度与实际负载不符）
+            budget = self._stream_budget()
+            if 0 < budget < concurrency:
+                logger.warning(
+                    f"{self.engine.config.name}: concurrency {concurrency} exceeds the connection stream budget "
+                    f"({budget}); excess RPCs queue inside the gRPC channels"
+                )
+            tasks = [asyncio.create_task(self._run_concurrent_iteration(test_name, i)) for i in range(concurrency)]
 
             # 等待所有任务完成
             results = await asyncio.gather(*tasks, return_exceptions=True)
@@ -283,6 +345,13 @@ class BaseExecutor(abc.ABC):
                 error_message=msg
             )
 
+    def _stream_budget(self) -> int:
+        """引擎连接可同时承载的在途请求数（0 表示不限制）"""
+        try:
+            return int(self.engine.stream_budget())
+        except Exception:
+            return 0
+
     async def _run_concurrent_iteration(self, test_name: str, task_id: int) -> List[PerformanceMetrics]:
         """运行单个并发迭代"""
         metrics = []
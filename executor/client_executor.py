@@ -2,21 +2,40 @@
 Client interface performance test executor
 """
 
+import itertools
+import os
 import time
 import asyncio
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
-import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+from functools import cached_property
 
-from .base import BaseExecutor, ExecutorType, TestContext, PerformanceMetrics
-from engines.base import BaseEngine
+from .base import BaseExecutor, ExecutorType, MetricSpan, TestContext, PerformanceMetrics, count_table_rows, resolve_executable
+from engines.base import BaseEngine, EngineType
+
+
+# 引擎类型 -> 客户端命令
+_CLIENT_CMDS: Dict[EngineType, str] = {
+    EngineType.ISULAD: "isula",   # iSulad客户端命令
+    EngineType.DOCKER: "docker",  # Docker客户端命令
+    EngineType.CRIO: "crictl",    # CRI-O客户端命令
+}
 
 
 @dataclass
 class _CmdResult:
+    """命令结果：保留原始字节，stdout/stderr 文本在首次访问时才解码"""
     returncode: int
-    stdout: str
-    stderr: str
+    stdout_bytes: bytes
+    stderr_bytes: bytes
+
+    @cached_property
+    def stdout(self) -> str:
+        return self.stdout_bytes.decode("utf-8", errors="replace")
+
+    @cached_property
+    def stderr(self) -> str:
+        return self.stderr_bytes.decode("utf-8", errors="replace")
 
 
 class ClientExecutor(BaseExecutor):
@@ -25,7 +44,16 @@ class ClientExecutor(BaseExecutor):
     def __init__(self, engine: BaseEngine, config):
         super().__init__(engine, config)
         self.test_containers = []
+        # exec 类测试共用的常驻空闲容器（首次需要时创建，teardown 时随本实例的测试容器一起清理）
+        self._idle_container: Optional[str] = None
         self.client_command = self._get_client_command()
+        # 测试容器名 = 实例前缀（创建时取一次随机数）+ 单调计数，创建容器时不再每次读随机数；
+        # _cleanup_test_resources 按此前缀只清理本实例的容器
+        self._name_prefix = f"perf-test-{os.urandom(4).hex()}-"
+        self._name_counter = itertools.count()
+
+    def _next_container_name(self) -> str:
+        return f"{self._name_prefix}{next(self._name_counter):06x}"
 
     def get_executor_type(self) -> ExecutorType:
         return ExecutorType.CLIENT
@@ -33,27 +61,20 @@ class ClientExecutor(BaseExecutor):
     def _get_client_command(self) -> str:
         """获取客户端命令"""
         engine_type = self.engine.get_engine_type()
-
-        if engine_type.value == "isulad":
-            return "isula"  # iSulad客户端命令
-        elif engine_type.value == "docker":
-            return "docker"  # Docker客户端命令
-        elif engine_type.value == "crio":
-            return "crictl"  # CRI-O客户端命令
-        else:
-            raise ValueError(f"Unsupported engine type: {engine_type}")
+        try:
+            return _CLIENT_CMDS[engine_type]
+        except KeyError:
+            raise ValueError(f"Unsupported engine type: {engine_type}") from None
 
     async def setup(self):
         """测试前准备"""
         # 确保客户端可用
         await self._check_client_available()
 
-        # 清理可能存在的测试资源
-        await self._cleanup_test_resources()
-
     async def teardown(self):
         """测试后清理"""
         await self._cleanup_test_resources()
+        self._idle_container = None
 
     async def _check_client_available(self):
         """检查客户端是否可用"""
@@ -65,33 +86,44 @@ class ClientExecutor(BaseExecutor):
             raise RuntimeError(f"Client {self.client_command} not found in PATH")
 
     async def _cleanup_test_resources(self):
-        """清理测试资源"""
+        """
+        清理本执行器创建的测试资源（一次列出 + 一次批量删除，不逐个容器起子进程）。
+
+        只匹配本实例的名字前缀：--parallel 下同一引擎上的其他任务的容器不受影响。
+        """
         try:
-            # 停止并删除测试容器
-            stop_result = await self._run_command([
+            if self.client_command == "crictl":
+                # crictl: 按名字正则直接取 ID；rm 不会停止运行中的容器，先批量 stop
+                ps_result = await self._run_command([
+                    self.client_command, "ps", "-a", "--name", f"^{self._name_prefix}", "-q"
+                ])
+                if ps_result.returncode != 0:
+                    return
+                ids = ps_result.stdout.split()
+                if ids:
+                    await self._run_command([self.client_command, "stop", *ids])
+                    await self._run_command([self.client_command, "rm", *ids])
+                return
+
+            ps_result = await self._run_command([
                 self.client_command, "ps", "-a", "--format", "{{.Names}}"
             ])
-
-            if stop_result.returncode == 0:
-                container_names = [
-                    line.strip() for line in stop_result.stdout.split('\n')
-                    if line.strip() and line.strip().startswith("perf-test-")
-                ]
-
-                for name in container_names:
-                    # 停止容器
-                    await self._run_command([self.client_command, "stop", name])
-                    # 删除容器
-                    await self._run_command([self.client_command, "rm", name])
+            if ps_result.returncode != 0:
+                return
+            container_names = [name for name in ps_result.stdout.split() if name.startswith(self._name_prefix)]
+            if container_names:
+                # 停止并删除测试容器（rm -f 一次完成）
+                await self._run_command([self.client_command, "rm", "-f", *container_names])
 
         except Exception:
             pass  # 忽略清理错误
 
-    async def _run_command(self, cmd: List[str], timeout: int = 30) -> _CmdResult:
-        """运行命令（异步）"""
+    async def _run_command(self, cmd: List[str], timeout: int = 30, capture_stdout: bool = True) -> _CmdResult:
+        """运行命令（异步）；capture_stdout=False 时 stdout 丢弃到 /dev/null（只关心返回码/错误输出的操作）"""
         proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=asyncio.subprocess.PIPE,
+            resolve_executable(cmd[0]),
+            *cmd[1:],
+            stdout=asyncio.subprocess.PIPE if capture_stdout else asyncio.subprocess.DEVNULL,
             stderr=asyncio.subprocess.PIPE,
         )
         try:
@@ -105,8 +137,58 @@ class ClientExecutor(BaseExecutor):
 
         return _CmdResult(
             returncode=proc.returncode or 0,
-            stdout=(stdout_b or b"").decode("utf-8", errors="replace"),
-            stderr=(stderr_b or b"").decode("utf-8", errors="replace"),
+            stdout_bytes=stdout_b or b"",
+            stderr_bytes=stderr_b or b"",
+        )
+
+    async def _measure(self, op: str, metadata: Dict[str, Any],
+                       cmd: Union[List[str], Callable[[], Awaitable[_CmdResult]]],
+                       capture_stdout: bool = True,
+                       extra: Optional[Callable[[_CmdResult], Dict[str, Any]]] = None) -> PerformanceMetrics:
+        """
+        计时执行一次客户端操作并生成指标（成功/失败/异常统一在此处理）。
+
+        cmd 为命令列表，或返回 _CmdResult 的无参协程函数（需要重试等自定义流程时）；
+        extra 仅在命令成功时调用，用结果补充 metadata。
+        """
+        span = MetricSpan()
+        try:
+            if callable(cmd):
+                result = await cmd()
+            else:
+                result = await self._run_command(cmd, capture_stdout=capture_stdout)
+        except Exception as e:
+            end_time = span.end()
+            success, error_message = False, str(e)
+        else:
+            end_time = span.end()
+            success = result.returncode == 0
+            error_message = None if success else result.stderr
+            if success and extra is not None:
+                metadata.update(extra(result))
+
+        return PerformanceMetrics(
+            operation=op,
+            start_time=span.start,
+            end_time=end_time,
+            duration=end_time - span.start,
+            success=success,
+            error_message=error_message,
+            metadata=metadata
+        )
+
+    @staticmethod
+    def _failed_metric(op: str, error_message: str, metadata: Optional[Dict[str, Any]] = None) -> PerformanceMetrics:
+        """未能执行被测操作时的占位失败指标（耗时为 0）"""
+        now = time.time()
+        return PerformanceMetrics(
+            operation=op,
+            start_time=now,
+            end_time=now,
+            duration=0,
+            success=False,
+            error_message=error_message,
+            metadata=metadata
         )
 
     async def run_single_test(self, context: TestContext) -> List[PerformanceMetrics]:
@@ -138,98 +220,29 @@ class ClientExecutor(BaseExecutor):
 
         except Exception as e:
             # 记录错误指标
-            metrics.append(PerformanceMetrics(
-                operation=test_name,
-                start_time=time.time(),
-                end_time=time.time(),
-                duration=0,
-                success=False,
-                error_message=str(e)
-            ))
+            metrics.append(self._failed_metric(test_name, str(e)))
 
         return metrics
 
     async def _test_pull_image_client(self, context: TestContext) -> List[PerformanceMetrics]:
         """测试客户端镜像拉取性能"""
-        metrics = []
-
         image = getattr(self.config, "image", "busybox:latest")
-
-        start_time = time.time()
-        try:
-            result = await self._run_command([self.client_command, "pull", image])
-            end_time = time.time()
-
-            success = result.returncode == 0
-            metrics.append(PerformanceMetrics(
-                operation="pull_image_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=success,
-                error_message=result.stderr if not success else None,
-                metadata={"image": image}
-            ))
-
-        except Exception as e:
-            end_time = time.time()
-            metrics.append(PerformanceMetrics(
-                operation="pull_image_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=False,
-                error_message=str(e)
-            ))
-
-        return metrics
+        return [await self._measure("pull_image_client", {"image": image}, [self.client_command, "pull", image])]
 
     async def _test_create_container_client(self, context: TestContext) -> List[PerformanceMetrics]:
         """测试客户端容器创建性能"""
-        metrics = []
-
         image = getattr(self.config, "image", "busybox:latest")
-        container_name = f"perf-test-{uuid.uuid4().hex[:8]}"
-
-        start_time = time.time()
-        try:
-            result = await self._run_command([
-                self.client_command, "create", "--name", container_name, image, "echo", "hello"
-            ])
-            end_time = time.time()
-
-            success = result.returncode == 0
-            container_id = result.stdout.strip() if success else None
-
-            metrics.append(PerformanceMetrics(
-                operation="create_container_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=success,
-                error_message=result.stderr if not success else None,
-                metadata={
-                    "container_name": container_name,
-                    "container_id": container_id,
-                    "image": image
-                }
-            ))
-
-            if success and container_id:
-                self.test_containers.append(container_name)
-
-        except Exception as e:
-            end_time = time.time()
-            metrics.append(PerformanceMetrics(
-                operation="create_container_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=False,
-                error_message=str(e)
-            ))
+        container_name = self._next_container_name()
 
-        return metrics
+        metric = await self._measure(
+            "create_container_client",
+            {"container_name": container_name, "container_id": None, "image": image},
+            [self.client_command, "create", "--name", container_name, image, "echo", "hello"],
+            extra=lambda r: {"container_id": r.stdout.strip() or None},
+        )
+        if metric.success and metric.metadata["container_id"]:
+            self.test_containers.append(container_name)
+        return [metric]
 
     async def _test_start_container_client(self, context: TestContext) -> List[PerformanceMetrics]:
         """测试客户端容器启动性能"""
@@ -244,33 +257,10 @@ class ClientExecutor(BaseExecutor):
 
         container_name = self.test_containers[-1]
 
-        start_time = time.time()
-        try:
-            result = await self._run_command([self.client_command, "start", container_name])
-            end_time = time.time()
-
-            success = result.returncode == 0
-            metrics.append(PerformanceMetrics(
-                operation="start_container_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=success,
-                error_message=result.stderr if not success else None,
-                metadata={"container_name": container_name}
-            ))
-
-        except Exception as e:
-            end_time = time.time()
-            metrics.append(PerformanceMetrics(
-                operation="start_container_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=False,
-                error_message=str(e)
-            ))
-
+        metrics.append(await self._measure(
+            "start_container_client", {"container_name": container_name},
+            [self.client_command, "start", container_name], capture_stdout=False,
+        ))
         return metrics
 
     async def _ensure_container_created_for_op(self, context: TestContext) -> Optional[str]:
@@ -304,18 +294,14 @@ class ClientExecutor(BaseExecutor):
         为 exec/logs 等需要“运行中且有输出”的操作准备一个长时间运行容器。
         重要：不要复用 create_container_client 的 `echo hello`（启动后会立刻退出，导致 exec/logs 大量失败）。
         注意：这里不把 create/start 的耗时计入调用方测试指标。
+        容器只创建一次并在各次迭代间复用；它不进入 test_containers，stop/remove 测试不会消耗它。
         """
-        if self.test_containers:
-            # best-effort ensure it's running
-            name = self.test_containers[-1]
-            try:
-                await self._run_command([self.client_command, "start", name])
-            except Exception:
-                pass
-            return name
+        if self._idle_container:
+            # exec 失败时调用方会 best-effort 重新 start，这里不再逐次 start
+            return self._idle_container
 
         image = getattr(self.config, "image", "busybox:latest")
-        container_name = f"perf-test-{uuid.uuid4().hex[:8]}"
+        container_name = self._next_container_name()
 
         # Candidate keepalive commands. We verify via `exec true` after start.
         keepalive_cmds = [
@@ -344,7 +330,7 @@ class ClientExecutor(BaseExecutor):
         for cmd_str in keepalive_cmds:
             ok = await _try_create_start(cmd_str)
             if ok:
-                self.test_containers.append(container_name)
+                self._idle_container = container_name
                 return container_name
             # cleanup failed attempt
             try:
@@ -360,43 +346,15 @@ class ClientExecutor(BaseExecutor):
 
         container_name = await self._ensure_container_started_for_op(context)
         if not container_name:
-            metrics.append(PerformanceMetrics(
-                operation="stop_container_client",
-                start_time=time.time(),
-                end_time=time.time(),
-                duration=0,
-                success=False,
-                error_message="No container available to stop (create/start failed)"
+            metrics.append(self._failed_metric(
+                "stop_container_client", "No container available to stop (create/start failed)"
             ))
             return metrics
 
-        start_time = time.time()
-        try:
-            result = await self._run_command([self.client_command, "stop", container_name])
-            end_time = time.time()
-
-            success = result.returncode == 0
-            metrics.append(PerformanceMetrics(
-                operation="stop_container_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=success,
-                error_message=result.stderr if not success else None,
-                metadata={"container_name": container_name}
-            ))
-
-        except Exception as e:
-            end_time = time.time()
-            metrics.append(PerformanceMetrics(
-                operation="stop_container_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=False,
-                error_message=str(e)
-            ))
-
+        metrics.append(await self._measure(
+            "stop_container_client", {"container_name": container_name},
+            [self.client_command, "stop", container_name], capture_stdout=False,
+        ))
         return metrics
 
     async def _test_remove_container_client(self, context: TestContext) -> List[PerformanceMetrics]:
@@ -405,183 +363,69 @@ class ClientExecutor(BaseExecutor):
 
         container_name = await self._ensure_container_created_for_op(context)
         if not container_name:
-            metrics.append(PerformanceMetrics(
-                operation="remove_container_client",
-                start_time=time.time(),
-                end_time=time.time(),
-                duration=0,
-                success=False,
-                error_message="No container available to remove (create failed)"
+            metrics.append(self._failed_metric(
+                "remove_container_client", "No container available to remove (create failed)"
             ))
             return metrics
         # remove will consume it from tracking list (best-effort)
         if self.test_containers and self.test_containers[-1] == container_name:
             self.test_containers.pop()
 
-        start_time = time.time()
-        try:
-            result = await self._run_command([self.client_command, "rm", container_name])
-            end_time = time.time()
-
-            success = result.returncode == 0
-            metrics.append(PerformanceMetrics(
-                operation="remove_container_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=success,
-                error_message=result.stderr if not success else None,
-                metadata={"container_name": container_name}
-            ))
-
-        except Exception as e:
-            end_time = time.time()
-            metrics.append(PerformanceMetrics(
-                operation="remove_container_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=False,
-                error_message=str(e)
-            ))
-
+        metrics.append(await self._measure(
+            "remove_container_client", {"container_name": container_name},
+            [self.client_command, "rm", container_name], capture_stdout=False,
+        ))
         return metrics
 
     async def _test_list_containers_client(self, context: TestContext) -> List[PerformanceMetrics]:
         """测试客户端列出容器性能"""
-        metrics = []
-
-        start_time = time.time()
-        try:
-            result = await self._run_command([self.client_command, "ps", "-a"])
-            end_time = time.time()
-
-            success = result.returncode == 0
-            container_count = len(result.stdout.strip().split('\n')) - 1 if success and result.stdout.strip() else 0
-
-            metrics.append(PerformanceMetrics(
-                operation="list_containers_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=success,
-                error_message=result.stderr if not success else None,
-                metadata={"container_count": container_count}
-            ))
-
-        except Exception as e:
-            end_time = time.time()
-            metrics.append(PerformanceMetrics(
-                operation="list_containers_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=False,
-                error_message=str(e)
-            ))
-
-        return metrics
+        return [await self._measure(
+            "list_containers_client", {"container_count": 0}, [self.client_command, "ps", "-a"],
+            extra=lambda r: {"container_count": count_table_rows(r.stdout_bytes)},
+        )]
 
     async def _test_list_images_client(self, context: TestContext) -> List[PerformanceMetrics]:
         """测试客户端列出镜像性能"""
-        metrics = []
-
-        start_time = time.time()
-        try:
-            result = await self._run_command([self.client_command, "images"])
-            end_time = time.time()
-
-            success = result.returncode == 0
-            image_count = len(result.stdout.strip().split('\n')) - 1 if success and result.stdout.strip() else 0
-
-            metrics.append(PerformanceMetrics(
-                operation="list_images_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=success,
-                error_message=result.stderr if not success else None,
-                metadata={"image_count": image_count}
-            ))
-
-        except Exception as e:
-            end_time = time.time()
-            metrics.append(PerformanceMetrics(
-                operation="list_images_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=False,
-                error_message=str(e)
-            ))
-
-        return metrics
+        return [await self._measure(
+            "list_images_client", {"image_count": 0}, [self.client_command, "images"],
+            extra=lambda r: {"image_count": count_table_rows(r.stdout_bytes)},
+        )]
 
     async def _test_exec_command_client(self, context: TestContext) -> List[PerformanceMetrics]:
         """测试客户端执行命令性能"""
         metrics = []
         container_name = await self._ensure_long_running_container_started_for_op(context)
         if not container_name:
-            metrics.append(PerformanceMetrics(
-                operation="exec_command_client",
-                start_time=time.time(),
-                end_time=time.time(),
-                duration=0,
-                success=False,
-                error_message="No running container available for exec (create/start failed)"
+            metrics.append(self._failed_metric(
+                "exec_command_client", "No running container available for exec (create/start failed)"
             ))
             return metrics
 
-        start_time = time.time()
-        try:
+        exec_cmd = [self.client_command, "exec", container_name, "sh", "-c", "echo test"]
+
+        async def run() -> _CmdResult:
             # Prefer running through shell to avoid edge cases of binary resolution.
-            result = await self._run_command([
-                self.client_command, "exec", container_name, "sh", "-c", "echo test"
-            ])
+            result = await self._run_command(exec_cmd)
             # If exec fails, the container may not be running (or runtime is flaky). Best-effort restart and retry once.
-            if result.returncode != 0:
-                err1 = (result.stderr or result.stdout or "").strip()
-                try:
-                    await self._run_command([self.client_command, "start", container_name])
-                except Exception:
-                    pass
-                result2 = await self._run_command([
-                    self.client_command, "exec", container_name, "sh", "-c", "echo test"
-                ])
-                if result2.returncode == 0:
-                    result = result2
-                else:
-                    err2 = (result2.stderr or result2.stdout or "").strip()
-                    # preserve both attempts for debugging/reporting
-                    result = _CmdResult(
-                        returncode=result2.returncode,
-                        stdout=result2.stdout,
-                        stderr=f"first_exec_error={err1}; retry_exec_error={err2}".strip()
-                    )
-            end_time = time.time()
-
-            success = result.returncode == 0
-            metrics.append(PerformanceMetrics(
-                operation="exec_command_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=success,
-                error_message=result.stderr if not success else None,
-                metadata={"container_name": container_name}
-            ))
-
-        except Exception as e:
-            end_time = time.time()
-            metrics.append(PerformanceMetrics(
-                operation="exec_command_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=False,
-                error_message=str(e)
-            ))
-
+            if result.returncode == 0:
+                return result
+            err1 = (result.stderr or result.stdout or "").strip()
+            try:
+                await self._run_command([self.client_command, "start", container_name])
+            except Exception:
+                pass
+            result2 = await self._run_command(exec_cmd)
+            if result2.returncode == 0:
+                return result2
+            err2 = (result2.stderr or result2.stdout or "").strip()
+            # preserve both attempts for debugging/reporting
+            return _CmdResult(
+                returncode=result2.returncode,
+                stdout_bytes=result2.stdout_bytes,
+                stderr_bytes=f"first_exec_error={err1}; retry_exec_error={err2}".strip().encode("utf-8")
+            )
+
+        metrics.append(await self._measure("exec_command_client", {"container_name": container_name}, run))
         return metrics
 
     async def _test_logs_client(self, context: TestContext) -> List[PerformanceMetrics]:
@@ -591,73 +435,35 @@ class ClientExecutor(BaseExecutor):
         # In many minimal/offline images, keeping a container alive reliably can be tricky, but
         # fetching logs from a short-lived container is stable (logs remain after exit).
         image = getattr(self.config, "image", "busybox:latest")
-        container_name = f"perf-test-{uuid.uuid4().hex[:8]}"
+        container_name = self._next_container_name()
 
         try:
             create_res = await self._run_command([
                 self.client_command, "create", "--name", container_name, image, "sh", "-c", "echo hello"
             ], timeout=30)
             if create_res.returncode != 0:
-                metrics.append(PerformanceMetrics(
-                    operation="logs_client",
-                    start_time=time.time(),
-                    end_time=time.time(),
-                    duration=0,
-                    success=False,
-                    error_message=(create_res.stderr or create_res.stdout or "").strip() or "create failed",
-                    metadata={"container_name": container_name}
+                metrics.append(self._failed_metric(
+                    "logs_client",
+                    (create_res.stderr or create_res.stdout or "").strip() or "create failed",
+                    {"container_name": container_name}
                 ))
                 return metrics
 
             start_res = await self._run_command([self.client_command, "start", container_name], timeout=30)
             if start_res.returncode != 0:
-                metrics.append(PerformanceMetrics(
-                    operation="logs_client",
-                    start_time=time.time(),
-                    end_time=time.time(),
-                    duration=0,
-                    success=False,
-                    error_message=(start_res.stderr or start_res.stdout or "").strip() or "start failed",
-                    metadata={"container_name": container_name}
+                metrics.append(self._failed_metric(
+                    "logs_client",
+                    (start_res.stderr or start_res.stdout or "").strip() or "start failed",
+                    {"container_name": container_name}
                 ))
                 return metrics
         except Exception as e:
-            metrics.append(PerformanceMetrics(
-                operation="logs_client",
-                start_time=time.time(),
-                end_time=time.time(),
-                duration=0,
-                success=False,
-                error_message=str(e),
-                metadata={"container_name": container_name}
-            ))
+            metrics.append(self._failed_metric("logs_client", str(e), {"container_name": container_name}))
             return metrics
 
-        start_time = time.time()
         try:
-            result = await self._run_command([self.client_command, "logs", container_name])
-            end_time = time.time()
-
-            success = result.returncode == 0
-            metrics.append(PerformanceMetrics(
-                operation="logs_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=success,
-                error_message=result.stderr if not success else None,
-                metadata={"container_name": container_name}
-            ))
-
-        except Exception as e:
-            end_time = time.time()
-            metrics.append(PerformanceMetrics(
-                operation="logs_client",
-                start_time=start_time,
-                end_time=end_time,
-                duration=end_time - start_time,
-                success=False,
-                error_message=str(e)
+            metrics.append(await self._measure(
+                "logs_client", {"container_name": container_name}, [self.client_command, "logs", container_name]
             ))
         finally:
             # best-effort cleanup of this dedicated container
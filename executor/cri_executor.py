@@ -7,15 +7,15 @@ and avoids hard dependency on protobuf stubs.
 
 import asyncio
 import json
+import logging
 import os
 import shutil
 import tempfile
-import time
 import uuid
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
-from .base import BaseExecutor, ExecutorType, TestContext
+from .base import BaseExecutor, ExecutorType, MetricSpan, TestContext, count_table_rows, resolve_executable
 from core.logger import get_logger
 from engines.base import BaseEngine, PerformanceMetrics
 
@@ -32,6 +32,9 @@ class _CmdResult:
 class CRIExecutor(BaseExecutor):
     """CRI接口性能测试执行器（通过crictl调用CRI）"""
 
+    # Max concurrent crictl processes during cleanup (caps fan-out against the runtime).
+    CLEANUP_CONCURRENCY = 8
+
     def __init__(self, engine: BaseEngine, config):
         super().__init__(engine, config)
         self.runtime_endpoint = engine.config.endpoint
@@ -86,9 +89,11 @@ class CRIExecutor(BaseExecutor):
         raise ValueError(f"Unknown CRI test: {name}")
 
     async def _run(self, args: List[str], timeout: int = 60) -> _CmdResult:
-        logger.debug(f"Run command (timeout={timeout}s): {' '.join(args)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Run command (timeout=%ss): %s", timeout, " ".join(args))
         proc = await asyncio.create_subprocess_exec(
-            *args,
+            resolve_executable(args[0]),
+            *args[1:],
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
         )
@@ -137,9 +142,10 @@ class CRIExecutor(BaseExecutor):
         return args
 
     async def _crictl_pull_image(self, image: str, warmup: bool) -> PerformanceMetrics:
-        start = time.time()
+        span = MetricSpan()
+        start = span.start
         res = await self._run(self._base_args() + ["pull", image], timeout=max(60, self.config.timeout if hasattr(self.config, "timeout") else 60))
-        end = time.time()
+        end = span.end()
         return PerformanceMetrics(
             operation="pull_image",
             start_time=start,
@@ -152,12 +158,11 @@ class CRIExecutor(BaseExecutor):
         )
 
     async def _crictl_list_containers(self, warmup: bool) -> PerformanceMetrics:
-        start = time.time()
+        span = MetricSpan()
+        start = span.start
         res = await self._run(self._base_args() + ["ps", "-a"], timeout=30)
-        end = time.time()
-        count = 0
-        if res.returncode == 0 and res.stdout.strip():
-            count = max(0, len(res.stdout.strip().splitlines()) - 1)
+        end = span.end()
+        count = count_table_rows(res.stdout) if res.returncode == 0 else 0
         return PerformanceMetrics(
             operation="list_containers",
             start_time=start,
@@ -170,12 +175,11 @@ class CRIExecutor(BaseExecutor):
         )
 
     async def _crictl_list_images(self, warmup: bool) -> PerformanceMetrics:
-        start = time.time()
+        span = MetricSpan()
+        start = span.start
         res = await self._run(self._base_args() + ["images"], timeout=30)
-        end = time.time()
-        count = 0
-        if res.returncode == 0 and res.stdout.strip():
-            count = max(0, len(res.stdout.strip().splitlines()) - 1)
+        end = span.end()
+        count = count_table_rows(res.stdout) if res.returncode == 0 else 0
         return PerformanceMetrics(
             operation="list_images",
             start_time=start,
@@ -189,9 +193,10 @@ class CRIExecutor(BaseExecutor):
 
     async def _crictl_stats(self, warmup: bool) -> PerformanceMetrics:
         # `crictl stats --no-stream` may require at least one running container; we do best-effort.
-        start = time.time()
+        span = MetricSpan()
+        start = span.start
         res = await self._run(self._base_args() + ["stats", "--no-stream"], timeout=30)
-        end = time.time()
+        end = span.end()
         return PerformanceMetrics(
             operation="container_stats",
             start_time=start,
@@ -268,9 +273,10 @@ class CRIExecutor(BaseExecutor):
         metrics: List[PerformanceMetrics] = []
 
         # runp
-        start = time.time()
+        span = MetricSpan()
+        start = span.start
         runp = await self._run(self._base_args() + ["runp", pod_path], timeout=30)
-        end = time.time()
+        end = span.end()
         sandbox_id = runp.stdout.strip().splitlines()[-1].strip() if runp.returncode == 0 else ""
         err_msg = None if runp.returncode == 0 else (runp.stderr.strip() or runp.stdout.strip())
         # Common CRI-O offline pitfall: runtime tries to pull default pause image (registry.k8s.io/pause:3.9).
@@ -301,9 +307,10 @@ class CRIExecutor(BaseExecutor):
         self._created.append(("pod", sandbox_id))
 
         # create
-        start = time.time()
+        span = MetricSpan()
+        start = span.start
         create = await self._run(self._base_args() + ["create", sandbox_id, ctr_path, pod_path], timeout=30)
-        end = time.time()
+        end = span.end()
         ctr_id = create.stdout.strip().splitlines()[-1].strip() if create.returncode == 0 else ""
         metrics.append(
             PerformanceMetrics(
@@ -325,13 +332,14 @@ class CRIExecutor(BaseExecutor):
             return metrics
 
         # start
-        start = time.time()
+        span = MetricSpan()
+        start = span.start
         start_res = await self._run(self._base_args() + ["start", ctr_id], timeout=30)
         if start_res.returncode != 0:
             # Best-effort retry once (state race / transient runtime issue)
             await asyncio.sleep(0.2)
             start_res = await self._run(self._base_args() + ["start", ctr_id], timeout=30)
-        end = time.time()
+        end = span.end()
         metrics.append(
             PerformanceMetrics(
                 operation="start_container",
@@ -350,13 +358,14 @@ class CRIExecutor(BaseExecutor):
         # stop
         # Give container a brief moment to enter Running state to avoid flakiness.
         await asyncio.sleep(0.1)
-        start = time.time()
+        span = MetricSpan()
+        start = span.start
         stop_res = await self._run(self._base_args() + ["stop", ctr_id], timeout=30)
         if stop_res.returncode != 0:
             # Best-effort retry once to handle state races.
             await asyncio.sleep(0.2)
             stop_res = await self._run(self._base_args() + ["stop", ctr_id], timeout=30)
-        end = time.time()
+        end = span.end()
         metrics.append(
             PerformanceMetrics(
                 operation="stop_container",
@@ -373,12 +382,13 @@ class CRIExecutor(BaseExecutor):
             return metrics
 
         # rm
-        start = time.time()
+        span = MetricSpan()
+        start = span.start
         rm_res = await self._run(self._base_args() + ["rm", ctr_id], timeout=30)
         if rm_res.returncode != 0:
             await asyncio.sleep(0.2)
             rm_res = await self._run(self._base_args() + ["rm", ctr_id], timeout=30)
-        end = time.time()
+        end = span.end()
         metrics.append(
             PerformanceMetrics(
                 operation="remove_container",
@@ -403,23 +413,30 @@ class CRIExecutor(BaseExecutor):
 
         # Use short timeouts for cleanup to avoid hanging on buggy runtime states.
         base = self._base_args(timeout_override_seconds=5)
+        sem = asyncio.Semaphore(self.CLEANUP_CONCURRENCY)
 
-        for kind, _id in reversed(items):
-            if not _id:
-                continue
-            try:
-                if kind == "container":
-                    # Container: stop (best-effort) then rm. Some runs keep the container running.
-                    await self._run(base + ["stop", _id], timeout=10)
-                    await self._run(base + ["rm", _id], timeout=10)
-                elif kind == "pod":
-                    # PodSandbox: stopp then rmp.
-                    await self._run(base + ["stopp", _id], timeout=10)
-                    await self._run(base + ["rmp", _id], timeout=10)
-                else:
-                    # Fallback: try common ops
-                    await self._run(base + ["rm", _id], timeout=5)
-                    await self._run(base + ["stopp", _id], timeout=5)
-                    await self._run(base + ["rmp", _id], timeout=5)
-            except Exception as e:
-                logger.debug(f"Ignore cleanup error for {kind}({_id}): {e}")
+        async def cleanup_one(kind: str, _id: str):
+            async with sem:
+                try:
+                    if kind == "container":
+                        # Container: stop (best-effort) then rm. Some runs keep the container running.
+                        await self._run(base + ["stop", _id], timeout=10)
+                        await self._run(base + ["rm", _id], timeout=10)
+                    elif kind == "pod":
+                        # PodSandbox: stopp then rmp.
+                        await self._run(base + ["stopp", _id], timeout=10)
+                        await self._run(base + ["rmp", _id], timeout=10)
+                    else:
+                        # Fallback: try common ops
+                        await self._run(base + ["rm", _id], timeout=5)
+                        await self._run(base + ["stopp", _id], timeout=5)
+                        await self._run(base + ["rmp", _id], timeout=5)
+                except Exception as e:
+                    logger.debug(f"Ignore cleanup error for {kind}({_id}): {e}")
+
+        # Resources are independent within a phase, so clean them concurrently;
+        # pods go last because their containers must be gone first.
+        items = [(kind, _id) for kind, _id in reversed(items) if _id]
+        for phase in ([it for it in items if it[0] != "pod"], [it for it in items if it[0] == "pod"]):
+            if phase:
+                await asyncio.gather(*(cleanup_one(kind, _id) for kind, _id in phase))
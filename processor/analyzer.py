@@ -3,11 +3,12 @@ Data analyzer for performance test results
 """
 
 import time
-import statistics
 import re
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from collections import defaultdict
 
+import numpy as np
+
 from .base import BaseProcessor, ProcessorType, ProcessedData
 from executor.base import TestResult
 from engines.base import PerformanceMetrics
@@ -16,10 +17,22 @@ from engines.base import PerformanceMetrics
 class DataAnalyzer(BaseProcessor):
     """性能测试数据分析器"""
 
+    # Subsets of _duration_stats() reported per engine / per engine comparison.
+    _ENGINE_ENTRY_KEYS = (
+        "avg_duration", "median_duration", "p95_duration", "p99_duration", "p25_duration",
+        "p75_duration", "iqr_duration", "cv_duration", "operations_per_second",
+    )
+    _COMPARISON_KEYS = (
+        "avg_duration", "operations_per_second", "median_duration", "p95_duration", "p99_duration",
+        "p25_duration", "p75_duration", "iqr_duration", "cv_duration",
+    )
+
     def __init__(self, baseline_engine: str = ""):
         super().__init__()
         # If set and present in the comparison set, we always use it as baseline.
         self.baseline_engine = (baseline_engine or "").strip()
+        # id(TestResult) -> (result, (durations, success mask)); filled by prepare() and process().
+        self._columns_cache: Dict[int, Tuple[TestResult, Tuple[np.ndarray, np.ndarray]]] = {}
 
     def get_processor_type(self) -> ProcessorType:
         return ProcessorType.ANALYZER
@@ -29,15 +42,21 @@ class DataAnalyzer(BaseProcessor):
         if not self.validate_input(test_results):
             raise ValueError("Invalid test results provided")
 
-        processed_data = {
-            "summary": self._generate_overall_summary(test_results),
-            "test_analysis": self._analyze_individual_tests(test_results),
-            "engine_comparison": self._compare_engines(test_results),
-            "performance_insights": self._generate_performance_insights(test_results),
-            "anomalies": self._detect_anomalies(test_results),
-            # Optional: concurrency sweep (scalability) analysis derived from *_concurrent_N results.
-            "scalability": self._analyze_scalability(test_results),
-        }
+        # Pack every result's metrics into columns once (reusing prepare()d ones); all passes below reuse them.
+        for r in test_results:
+            self.prepare(r)
+        try:
+            processed_data = {
+                "summary": self._generate_overall_summary(test_results),
+                "test_analysis": self._analyze_individual_tests(test_results),
+                "engine_comparison": self._compare_engines(test_results),
+                "performance_insights": self._generate_performance_insights(test_results),
+                "anomalies": self._detect_anomalies(test_results),
+                # Optional: concurrency sweep (scalability) analysis derived from *_concurrent_N results.
+                "scalability": self._analyze_scalability(test_results),
+            }
+        finally:
+            self._columns_cache = {}
         # High-level findings derived from comparisons (best-effort)
         processed_data["top_findings"] = self._generate_top_findings(processed_data)
 
@@ -49,6 +68,69 @@ class DataAnalyzer(BaseProcessor):
             timestamp=time.time()
         )
 
+    @staticmethod
+    def _pack_columns(result: TestResult) -> Tuple[np.ndarray, np.ndarray]:
+        """将 metrics 列表（AoS）转换为列式数组（SoA）：(durations, success mask)"""
+        metrics = result.metrics or []
+        n = len(metrics)
+        durations = np.fromiter((m.duration for m in metrics), dtype=np.float64, count=n)
+        success = np.fromiter((bool(m.success) for m in metrics), dtype=bool, count=n)
+        return durations, success
+
+    def prepare(self, result: TestResult):
+        """
+        Pre-pack a finished result's metrics so process() only has to reduce them.
+
+        Callers running many tests can call this as each result arrives, overlapping the packing
+        with tests that are still running.
+        """
+        entry = self._columns_cache.get(id(result))
+        if entry is None or entry[0] is not result:
+            self._columns_cache[id(result)] = (result, self._pack_columns(result))
+
+    def _columns(self, result: TestResult) -> Tuple[np.ndarray, np.ndarray]:
+        """获取结果的列式视图（优先使用缓存）"""
+        entry = self._columns_cache.get(id(result))
+        if entry is not None and entry[0] is result:
+            return entry[1]
+        return self._pack_columns(result)
+
+    def _success_durations(self, result: TestResult) -> np.ndarray:
+        """成功操作的耗时数组"""
+        durations, success = self._columns(result)
+        return durations[success]
+
+    def _duration_stats(self, durations: np.ndarray) -> Dict[str, float]:
+        """
+        Latency statistics over successful durations (non-empty), computed from a single sort.
+        Percentiles keep the nearest-rank definition of `_percentile`.
+        """
+        data = np.sort(durations)
+        n = int(data.size)
+
+        def pct(p: float) -> float:
+            return float(data[min(int(n * p / 100), n - 1)])
+
+        mean_v = float(data.mean())
+        std_v = float(data.std(ddof=1)) if n > 1 else 0.0
+        total = float(data.sum())
+        p25 = pct(25)
+        p75 = pct(75)
+        return {
+            "avg_duration": mean_v,
+            "min_duration": float(data[0]),
+            "max_duration": float(data[-1]),
+            "std_duration": std_v,
+            "median_duration": float(np.median(data)),
+            "p25_duration": p25,
+            "p75_duration": p75,
+            "iqr_duration": max(0.0, p75 - p25),
+            "p95_duration": pct(95),
+            "p99_duration": pct(99),
+            "operations_per_second": n / total if total > 0 else 0,
+            "cv_duration": (std_v / mean_v) if mean_v > 0 else 0.0,
+        }
+
     def _analyze_scalability(self, test_results: List[TestResult]) -> Dict[str, Any]:
         """
         Detect concurrency sweep runs and summarize scaling curves.
@@ -119,16 +201,16 @@ class DataAnalyzer(BaseProcessor):
         successful_tests = len([r for r in test_results if r.success])
         failed_tests = total_tests - successful_tests
 
-        total_metrics = []
+        total_operations = 0
+        successful_operations = 0
         total_duration = 0
 
         for result in test_results:
-            total_metrics.extend(result.metrics)
+            _, success = self._columns(result)
+            total_operations += int(success.size)
+            successful_operations += int(np.count_nonzero(success))
             total_duration += (result.end_time - result.start_time)
 
-        successful_operations = len([m for m in total_metrics if m.success])
-        total_operations = len(total_metrics)
-
         return {
             "total_tests": total_tests,
             "successful_tests": successful_tests,
@@ -160,18 +242,14 @@ class DataAnalyzer(BaseProcessor):
         if not results:
             return {}
 
-        # 收集所有指标
-        all_metrics = []
-        for result in results:
-            all_metrics.extend(result.metrics)
-
-        if not all_metrics:
+        # 收集所有指标（列式）
+        total_ops = sum(len(r.metrics) for r in results)
+        if not total_ops:
             return {"error": "No metrics available"}
 
         # 计算性能统计
-        durations = [m.duration for m in all_metrics if m.success]
-        successful_ops = len([m for m in all_metrics if m.success])
-        total_ops = len(all_metrics)
+        durations = np.concatenate([self._success_durations(r) for r in results])
+        successful_ops = int(durations.size)
 
         analysis = {
             "test_count": len(results),
@@ -180,49 +258,33 @@ class DataAnalyzer(BaseProcessor):
             "success_rate": successful_ops / total_ops if total_ops > 0 else 0,
         }
 
-        if durations:
-            p25 = self._percentile(durations, 25)
-            p75 = self._percentile(durations, 75)
-            mean_v = statistics.mean(durations)
-            std_v = statistics.stdev(durations) if len(durations) > 1 else 0
-            analysis.update({
-                "avg_duration": mean_v,
-                "min_duration": min(durations),
-                "max_duration": max(durations),
-                "std_duration": std_v,
-                "median_duration": statistics.median(durations),
-                "p25_duration": p25,
-                "p75_duration": p75,
-                "iqr_duration": max(0.0, p75 - p25),
-                "p95_duration": self._percentile(durations, 95),
-                "p99_duration": self._percentile(durations, 99),
-                "operations_per_second": len(durations) / sum(durations) if sum(durations) > 0 else 0,
-                "cv_duration": (std_v / mean_v) if mean_v > 0 else 0.0,
-            })
+        if durations.size:
+            analysis.update(self._duration_stats(durations))
 
         # 按引擎分组分析
         engines = defaultdict(list)
         for result in results:
-            engines[result.engine_name].extend(result.metrics)
+            engines[result.engine_name].append(result)
 
         analysis["engines"] = {}
         max_samples = 200  # keep HTML report size reasonable
-        for engine_name, metrics in engines.items():
-            engine_durations = [m.duration for m in metrics if m.success]
-            engine_failed = len(metrics) - len(engine_durations)
+        for engine_name, engine_results in engines.items():
+            operation_count = sum(len(r.metrics) for r in engine_results)
+            engine_durations = np.concatenate([self._success_durations(r) for r in engine_results])
+            engine_failed = operation_count - int(engine_durations.size)
             engine_entry = {
-                "operation_count": len(metrics),
-                "successful_count": len(engine_durations),
+                "operation_count": operation_count,
+                "successful_count": int(engine_durations.size),
                 "failed_count": engine_failed,
-                "success_rate": (len(engine_durations) / len(metrics)) if metrics else 0,
+                "success_rate": (int(engine_durations.size) / operation_count) if operation_count else 0,
             }
             # Keep a small sample of durations for plotting (seconds)
-            if engine_durations:
-                engine_entry["duration_samples"] = engine_durations[:max_samples]
+            if engine_durations.size:
+                engine_entry["duration_samples"] = engine_durations[:max_samples].tolist()
             if engine_failed:
                 # Collect a few representative error messages for debugging/reporting.
                 samples = []
-                for m in metrics:
+                for m in (m for r in engine_results for m in r.metrics):
                     if m.success:
                         continue
                     msg = (m.error_message or "").strip()
@@ -234,22 +296,9 @@ class DataAnalyzer(BaseProcessor):
                         break
                 if samples:
                     engine_entry["error_samples"] = samples
-            if engine_durations:
-                p25 = self._percentile(engine_durations, 25)
-                p75 = self._percentile(engine_durations, 75)
-                mean_v = statistics.mean(engine_durations)
-                std_v = statistics.stdev(engine_durations) if len(engine_durations) > 1 else 0
-                engine_entry.update({
-                    "avg_duration": mean_v,
-                    "median_duration": statistics.median(engine_durations),
-                    "p95_duration": self._percentile(engine_durations, 95),
-                    "p99_duration": self._percentile(engine_durations, 99),
-                    "p25_duration": p25,
-                    "p75_duration": p75,
-                    "iqr_duration": max(0.0, p75 - p25),
-                    "cv_duration": (std_v / mean_v) if mean_v > 0 else 0.0,
-                    "operations_per_second": len(engine_durations) / sum(engine_durations) if sum(engine_durations) > 0 else 0,
-                })
+            if engine_durations.size:
+                stats = self._duration_stats(engine_durations)
+                engine_entry.update({k: stats[k] for k in self._ENGINE_ENTRY_KEYS})
             analysis["engines"][engine_name] = engine_entry
 
         return analysis
@@ -289,24 +338,12 @@ class DataAnalyzer(BaseProcessor):
             # 找到该引擎的这个测试结果
             test_result = next((r for r in results if r.test_name == test_name), None)
             if test_result and test_result.metrics:
-                durations = [m.duration for m in test_result.metrics if m.success]
-                if durations:
-                    p25 = self._percentile(durations, 25)
-                    p75 = self._percentile(durations, 75)
-                    mean_v = statistics.mean(durations)
-                    std_v = statistics.stdev(durations) if len(durations) > 1 else 0
-                    engine_metrics[engine_name] = {
-                        "avg_duration": mean_v,
-                        "operations_per_second": len(durations) / sum(durations),
-                        "success_rate": len(durations) / len(test_result.metrics),
-                        "median_duration": statistics.median(durations),
-                        "p95_duration": self._percentile(durations, 95),
-                        "p99_duration": self._percentile(durations, 99),
-                        "p25_duration": p25,
-                        "p75_duration": p75,
-                        "iqr_duration": max(0.0, p75 - p25),
-                        "cv_duration": (std_v / mean_v) if mean_v > 0 else 0.0,
-                    }
+                durations = self._success_durations(test_result)
+                if durations.size:
+                    stats = self._duration_stats(durations)
+                    entry = {k: stats[k] for k in self._COMPARISON_KEYS}
+                    entry["success_rate"] = int(durations.size) / len(test_result.metrics)
+                    engine_metrics[engine_name] = entry
 
         if len(engine_metrics) < 2:
             return {"error": "Insufficient data for comparison"}
@@ -377,9 +414,9 @@ class DataAnalyzer(BaseProcessor):
         # 分析瓶颈
         for result in test_results:
             if result.metrics:
-                durations = [m.duration for m in result.metrics if m.success]
-                if durations:
-                    avg_duration = statistics.mean(durations)
+                durations = self._success_durations(result)
+                if durations.size:
+                    avg_duration = float(durations.mean())
                     if avg_duration > 1.0:  # 超过1秒的操作
                         insights["bottlenecks"].append({
                             "test": result.test_name,
@@ -444,27 +481,27 @@ class DataAnalyzer(BaseProcessor):
             if not result.metrics:
                 continue
 
-            durations = [m.duration for m in result.metrics if m.success]
-            if len(durations) < 3:  # 需要足够的样本
+            durations = self._success_durations(result)
+            if durations.size < 3:  # 需要足够的样本
                 continue
 
-            mean_duration = statistics.mean(durations)
-            stdev_duration = statistics.stdev(durations)
+            mean_duration = float(durations.mean())
+            stdev_duration = float(durations.std(ddof=1))
 
             # 检测异常值（超出3个标准差）
             threshold = mean_duration + 3 * stdev_duration
 
-            for i, duration in enumerate(durations):
-                if duration > threshold:
-                    anomalies.append({
-                        "type": "outlier_duration",
-                        "test": result.test_name,
-                        "engine": result.engine_name,
-                        "iteration": i,
-                        "duration": duration,
-                        "mean_duration": mean_duration,
-                        "deviation_sigma": (duration - mean_duration) / stdev_duration
-                    })
+            for i in np.flatnonzero(durations > threshold):
+                duration = float(durations[i])
+                anomalies.append({
+                    "type": "outlier_duration",
+                    "test": result.test_name,
+                    "engine": result.engine_name,
+                    "iteration": int(i),
+                    "duration": duration,
+                    "mean_duration": mean_duration,
+                    "deviation_sigma": (duration - mean_duration) / stdev_duration
+                })
 
         return anomalies
 
@@ -475,10 +512,10 @@ class DataAnalyzer(BaseProcessor):
 
         for result in results:
             if result.metrics:
-                durations = [m.duration for m in result.metrics if m.success]
-                if durations:
-                    total_duration += sum(durations)
-                    count += len(durations)
+                durations = self._success_durations(result)
+                if durations.size:
+                    total_duration += float(durations.sum())
+                    count += int(durations.size)
 
         return total_duration / count if count > 0 else 0
 
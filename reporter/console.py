@@ -2,7 +2,6 @@
 Console result reporter
 """
 
-import json
 from typing import Dict, Any, Optional
 from rich.console import Console
 from rich.table import Table
@@ -13,6 +12,7 @@ from rich.layout import Layout
 
 from .base import BaseReporter, ReporterType
 from processor.base import ProcessedData
+from utils.artifacts import write_json
 
 
 class ConsoleReporter(BaseReporter):
@@ -239,12 +239,11 @@ class ConsoleReporter(BaseReporter):
         """保存到文件"""
         output_path = self._get_output_path(output_file)
 
-        # 将处理后的数据保存为JSON格式
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump({
-                "timestamp": processed_data.timestamp,
-                "processed_data": processed_data.processed_data,
-                "metadata": processed_data.metadata
-            }, f, indent=2, ensure_ascii=False)
+        # 将处理后的数据保存为JSON格式（与 run 目录产物共用 orjson 编码路径）
+        write_json(output_path, {
+            "timestamp": processed_data.timestamp,
+            "processed_data": processed_data.processed_data,
+            "metadata": processed_data.metadata
+        })
 
         self.console.print(f"Report saved to: {output_path}")
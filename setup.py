@@ -2,6 +2,8 @@
 iSulad Performance Testing Framework Setup
 """
 
+import os
+
 from setuptools import setup, find_packages
 
 with open("README.md", "r", encoding="utf-8") as fh:
@@ -10,6 +12,18 @@ with open("README.md", "r", encoding="utf-8") as fh:
 with open("requirements.txt", "r", encoding="utf-8") as fh:
     requirements = [line.strip() for line in fh if line.strip() and not line.startswith("#")]
 
+# 可选：ISULAD_PERF_MYPYC=1 时用 mypyc 将纯 Python 的热点模块编译为 C 扩展；
+# 未安装 mypy 或未开启时保持纯 Python 安装
+MYPYC_MODULES = ["core/config.py"]
+ext_modules = []
+if os.environ.get("ISULAD_PERF_MYPYC"):
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print("mypy not installed, building pure-Python package")
+    else:
+        ext_modules = mypycify(["--ignore-missing-imports", "--explicit-package-bases"] + MYPYC_MODULES)
+
 setup(
     name="isulad-perf-framework",
     version="0.1.0",
@@ -33,6 +47,7 @@ setup(
     ],
     python_requires=">=3.8",
     install_requires=requirements,
+    ext_modules=ext_modules,
     entry_points={
         "console_scripts": [
             "isulad-perf=isulad_perf.cli.main:main",
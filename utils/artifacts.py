@@ -1,12 +1,24 @@
 from __future__ import annotations
 
 import json
+import os
 import re
 import time
 from dataclasses import asdict, is_dataclass
+from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+# orjson is optional: C-accelerated encoding when installed, stdlib json otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+)
+
 
 def _safe_name(s: str) -> str:
     s = (s or "").strip()
@@ -48,7 +60,36 @@ def _to_jsonable(obj: Any) -> Any:
     return obj
 
 
-def write_json(path: Path, data: Any):
+def _json_default(obj: Any) -> Any:
+    # Enums are written by value with either backend (e.g. ExecutorType.CRI -> "cri").
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+
+def dumps_json(data: Any) -> bytes:
+    """Encode artifact data as indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        # orjson serializes dataclasses natively, no asdict() round-trip needed.
+        return orjson.dumps(data, default=_json_default, option=_ORJSON_OPTIONS)
+    return json.dumps(_to_jsonable(data), ensure_ascii=False, indent=2, default=_json_default).encode("utf-8")
+
+
+def write_bytes(path: Path, payload: bytes):
+    """Write bytes atomically: an interrupted run never leaves a half-written artifact behind."""
+    path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(_to_jsonable(data), f, ensure_ascii=False, indent=2, default=str)
\ No newline at end of file
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        tmp.write_bytes(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def write_json(path: Path, data: Any):
+    write_bytes(path, dumps_json(data))